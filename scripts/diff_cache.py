@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+diff_cache.py
+=============
+On-disk cache of PR diffs and merged PR metadata for the RDK-B release agent.
+
+A merged PR's diff never changes once its merge commit SHA is known, so
+diffs are stored content-addressed by that SHA, per repository, in the
+private per-user cache directory (utils.USER_CACHE_DIR):
+
+  ~/.cache/rdkb-release-agent/diffs/{owner}/{repo}/{sha}.v1.diff
+
+Metadata of merged PRs (title, author, files, merge commit) is likewise
+kept in one JSON file per repository:
+
+  ~/.cache/rdkb-release-agent/pr_metadata/{owner}/{repo}.v1.json
+
+The "v1" in the names is the cache format version; bumping it makes old
+entries unreachable.
+
+Re-runs (dry-run → real run, config tweaks) then read both from disk
+instead of calling GitHub again. Diffs older than 30 days are pruned at
+orchestrator startup; `--no-cache` bypasses both caches.
+
+Diffs are fetched over the shared keep-alive GitHubClient when a token is
+available, with `gh pr diff` as the fallback. fetch_pr_diffs() fetches
+many diffs concurrently (each is an independent network round-trip); a
+module-wide semaphore caps the number of in-flight requests to stay clear
+of GitHub's secondary rate limits.
+"""
+
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from github_api import fetch_prs_metadata, get_client
+from utils import USER_CACHE_DIR, make_cache_dir, read_json, write_json
+
+
+DIFF_CACHE_DIR = USER_CACHE_DIR / "diffs"
+PR_METADATA_CACHE_DIR = USER_CACHE_DIR / "pr_metadata"
+CACHE_FORMAT_VERSION = 1   # Part of every cache file name
+DIFF_CACHE_MAX_AGE_DAYS = 30
+DIFF_FETCH_WORKERS = 8     # Default thread pool size for fetch_pr_diffs()
+GH_MAX_IN_FLIGHT = 10      # Max concurrent diff requests, process-wide
+
+_gh_slots = threading.Semaphore(GH_MAX_IN_FLIGHT)
+
+
+def _cache_path(sha: str, repo: Optional[str] = None) -> Path:
+    # Scoped by repo so SHAs from different repositories can never collide
+    return (DIFF_CACHE_DIR / repo if repo else DIFF_CACHE_DIR) / f"{sha}.v{CACHE_FORMAT_VERSION}.diff"
+
+
+def get_pr_diff(pr_number: int, repo: Optional[str] = None, sha: Optional[str] = None,
+                use_cache: bool = True, timeout: int = 30) -> Optional[str]:
+    """
+    Get a PR's unified diff, from the disk cache when possible.
+
+    Args:
+        pr_number: PR number
+        repo: GitHub repo (owner/name); None uses the current checkout's remote
+        sha: Merge commit SHA (cache key); without it the cache is skipped
+        use_cache: Set False to bypass the cache (always fetch)
+        timeout: `gh pr diff` timeout in seconds (fallback path)
+
+    Returns:
+        Diff text, or None if it could not be fetched
+    """
+    cache_file = _cache_path(sha, repo) if sha else None
+
+    if use_cache and cache_file and cache_file.exists():
+        try:
+            return cache_file.read_text(errors="replace")
+        except OSError:
+            pass
+
+    diff_text = None
+    with _gh_slots:
+        client = get_client() if repo else None
+        if client:
+            try:
+                diff_text = client.pr_diff(repo, pr_number)
+            except Exception:
+                pass  # Fall back to gh
+        if diff_text is None:
+            cmd = ["gh", "pr", "diff", str(pr_number)]
+            if repo:
+                cmd.extend(["--repo", repo])
+            # Raw bytes: a diff of non-UTF-8 source files must not fail to decode
+            result = subprocess.run(cmd, capture_output=True, timeout=timeout)
+            if result.returncode != 0:
+                return None
+            diff_text = result.stdout.decode("utf-8", errors="replace")
+    if cache_file:
+        try:
+            # Atomic write: readers never see a partially written diff
+            make_cache_dir(cache_file.parent)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(diff_text)
+            tmp_file.replace(cache_file)
+        except OSError:
+            pass
+
+    return diff_text
+
+
+def fetch_pr_diffs(pr_numbers: List[int], repo: Optional[str] = None,
+                   shas: Optional[Dict[int, str]] = None, use_cache: bool = True,
+                   max_workers: int = DIFF_FETCH_WORKERS) -> Dict[int, Optional[str]]:
+    """
+    Fetch the diffs of many PRs concurrently.
+
+    Args:
+        pr_numbers: PR numbers
+        repo: GitHub repo (owner/name); None uses the current checkout's remote
+        shas: Optional PR number -> merge commit SHA map (cache keys)
+        use_cache: Set False to bypass the cache (always fetch)
+        max_workers: Thread pool size
+
+    Returns:
+        Dict mapping PR number -> diff text (None if it could not be fetched
+        or the fetch failed/timed out)
+    """
+    shas = shas or {}
+
+    def fetch(pr_number):
+        try:
+            return get_pr_diff(pr_number, repo=repo, sha=shas.get(pr_number),
+                               use_cache=use_cache)
+        except Exception:
+            return None
+
+    if len(pr_numbers) <= 1:
+        return {pr: fetch(pr) for pr in pr_numbers}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(pr_numbers, executor.map(fetch, pr_numbers)))
+
+
+def get_prs_metadata(repo: str, prs: List[int], with_files: bool = False,
+                     use_cache: bool = True) -> Dict[int, Dict]:
+    """
+    Get metadata for many PRs, serving merged PRs from the disk cache.
+
+    Cache misses are fetched with fetch_prs_metadata() (batched GraphQL);
+    the merged PRs among them are added to the cache. Open PRs are never
+    cached, since they can still change.
+
+    Args:
+        repo: GitHub repo (owner/name)
+        prs: PR numbers
+        with_files: Also return the changed file paths
+        use_cache: Set False to bypass the cache (always fetch)
+
+    Returns:
+        Dict mapping PR number -> metadata (`gh pr view --json` shape),
+        in the order of prs. PRs that are not found are omitted.
+    """
+    cache_file = PR_METADATA_CACHE_DIR / f"{repo}.v{CACHE_FORMAT_VERSION}.json"
+    cached = {}
+    if use_cache and cache_file.exists():
+        try:
+            cached = read_json(cache_file)
+        except Exception:
+            cached = {}
+
+    def usable(entry):
+        return entry is not None and (not with_files or "files" in entry)
+
+    missing = [pr for pr in prs if not usable(cached.get(str(pr)))]
+    fetched = fetch_prs_metadata(repo, missing, with_files=with_files) if missing else {}
+
+    new_entries = {str(pr): data for pr, data in fetched.items() if data.get("mergedAt")}
+    if new_entries:
+        cached.update(new_entries)
+        try:
+            # Atomic write: concurrent runs never see a partially written file
+            make_cache_dir(cache_file.parent)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            write_json(tmp_file, cached, indent=False)
+            tmp_file.replace(cache_file)
+        except OSError:
+            pass
+
+    result = {}
+    for pr in prs:
+        data = fetched.get(pr) or cached.get(str(pr))
+        if data is not None:
+            result[pr] = data
+    return result
+
+
+def prune_diff_cache(max_age_days: int = DIFF_CACHE_MAX_AGE_DAYS) -> int:
+    """
+    Remove cached diffs older than max_age_days.
+
+    Returns:
+        Number of entries removed
+    """
+    if not DIFF_CACHE_DIR.exists():
+        return 0
+
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for entry in DIFF_CACHE_DIR.rglob("*.diff"):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+                removed += 1
+        except OSError:
+            pass
+    return removed
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+github_api.py
+=============
+Batched GitHub API access for the RDK-B release agent.
+
+Fetching data one PR at a time (`gh pr view N` in a loop) costs one API
+round-trip per PR. This module collapses those loops into a single GraphQL
+request per page of PRs, using aliased `pullRequest(number: N)` fields:
+
+  query($owner: String!, $name: String!) {
+    repository(owner: $owner, name: $name) {
+      pr19: pullRequest(number: 19) { number mergedAt mergeCommit { oid } }
+      pr20: pullRequest(number: 20) { number mergedAt mergeCommit { oid } }
+    }
+  }
+
+The repository owner and name are passed as GraphQL variables, never
+formatted into the query text.
+
+fetch_prs_metadata() uses the same batching for full PR metadata (title,
+author, merge commit, counts and optionally changed files), in pages of
+50 PRs to keep each response small.
+
+Requests go straight to the GitHub API over reused keep-alive HTTPS
+connections (GitHubClient) when a token is available — from GH_TOKEN /
+GITHUB_TOKEN, or `gh auth token` — so each call costs neither a `gh`
+process spawn nor a fresh TLS handshake. The same client opens the draft
+release PR. GH_HOST selects a GitHub Enterprise Server host (its API lives
+under /api/v3 and /api/graphql), so its token is only ever sent there.
+Without a token, or if a direct request fails, calls fall back to the `gh`
+CLI.
+"""
+
+import http.client
+import json
+import os
+import queue
+import subprocess
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+GRAPHQL_PAGE_SIZE = 100  # PRs per GraphQL request
+GRAPHQL_METADATA_PAGE_SIZE = 50  # PRs per request when fetching full metadata
+
+# Per-PR fields for fetch_prs_metadata(); files are requested separately
+# since only the conflict analyzer needs them
+PR_METADATA_FIELDS = (
+    "number title url mergedAt additions deletions "
+    "author { login } mergeCommit { oid } commits { totalCount }"
+)
+PR_FILES_FIELD = "files(first: 100) { nodes { path } }"
+
+GITHUB_HOST = "github.com"
+GITHUB_API_HOST = "api.github.com"
+
+
+def _api_endpoint(gh_host: str) -> Tuple[str, str, str]:
+    """
+    API location for a GitHub host.
+
+    Returns:
+        (API host, REST path prefix, GraphQL path)
+    """
+    if gh_host == GITHUB_HOST:
+        return GITHUB_API_HOST, "", "/graphql"
+    # GitHub Enterprise Server
+    return gh_host, "/api/v3", "/api/graphql"
+
+
+class GitHubClient:
+    """
+    Minimal GitHub REST/GraphQL client over reused HTTPS connections.
+
+    Idle connections are kept in a pool and handed to one thread at a time,
+    so concurrent callers (e.g. parallel diff fetches) each get their own
+    connection while sequential calls reuse the same one.
+    """
+
+    def __init__(self, token: str, gh_host: str = GITHUB_HOST, timeout: int = 30):
+        self.host, self._rest_prefix, self._graphql_path = _api_endpoint(gh_host)
+        self.timeout = timeout
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "User-Agent": "rdkb-release-agent",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        self._idle = queue.LifoQueue()
+
+    def _connect(self) -> http.client.HTTPSConnection:
+        return http.client.HTTPSConnection(self.host, timeout=self.timeout)
+
+    def request(self, method: str, path: str, body: Optional[Dict] = None,
+                accept: str = "application/vnd.github+json") -> Tuple[int, bytes]:
+        """
+        Send one API request.
+
+        A GET that fails on a reused connection (the server may have closed
+        it while idle) is retried once on a fresh one. Other methods are
+        never re-sent, since the first attempt may already have taken effect.
+
+        Args:
+            path: REST path (e.g. "/repos/o/r/pulls"), or the GraphQL path
+
+        Returns:
+            (HTTP status, response body)
+        """
+        headers = {**self._headers, "Accept": accept}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+
+        try:
+            conn.request(method, path, body=payload, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if method != "GET":
+                raise
+            conn = self._connect()
+            try:
+                conn.request(method, path, body=payload, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                raise
+
+        self._idle.put(conn)
+        return response.status, data
+
+    def graphql(self, query: str, variables: Optional[Dict] = None) -> Optional[Dict]:
+        """Run a GraphQL query; returns the parsed response, or None on HTTP error."""
+        status, data = self.request("POST", self._graphql_path,
+                                    {"query": query, "variables": variables or {}})
+        return json.loads(data) if status == 200 else None
+
+    def pr_diff(self, repo: str, pr_number: int) -> Optional[str]:
+        """Fetch a PR's unified diff; returns None on HTTP error."""
+        status, data = self.request(
+            "GET", f"{self._rest_prefix}/repos/{repo}/pulls/{pr_number}",
+            accept="application/vnd.github.v3.diff"
+        )
+        return data.decode("utf-8", errors="replace") if status == 200 else None
+
+    def create_pr(self, repo: str, base: str, head: str, title: str, body: str,
+                  draft: bool = False) -> Tuple[Optional[str], str]:
+        """
+        Open a pull request.
+
+        Returns:
+            (PR URL, "") on success, or (None, error message) on HTTP error
+        """
+        status, data = self.request("POST", f"{self._rest_prefix}/repos/{repo}/pulls", {
+            "base": base, "head": head, "title": title, "body": body, "draft": draft,
+        })
+        if status == 201:
+            return json.loads(data)["html_url"], ""
+        return None, data.decode("utf-8", errors="replace")
+
+
+_client = None
+_client_loaded = False
+_client_lock = threading.Lock()
+
+
+def get_client() -> Optional[GitHubClient]:
+    """
+    Shared GitHubClient, created on first use.
+
+    The client talks to GH_HOST (default github.com), like `gh` does.
+
+    Returns:
+        The client, or None if no token is available (callers then use `gh`)
+    """
+    global _client, _client_loaded
+    with _client_lock:
+        if not _client_loaded:
+            _client_loaded = True
+            gh_host = os.environ.get("GH_HOST") or GITHUB_HOST
+            token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+            if not token:
+                try:
+                    result = subprocess.run(["gh", "auth", "token", "--hostname", gh_host],
+                                            capture_output=True, text=True, timeout=10)
+                    token = result.stdout.strip() if result.returncode == 0 else None
+                except Exception:
+                    token = None
+            if token:
+                _client = GitHubClient(token, gh_host)
+    return _client
+
+
+def _report_graphql_errors(response: Dict) -> None:
+    """Print the "errors" of a GraphQL response (returned even with HTTP 200)."""
+    errors = response.get("errors") or []
+    for error in errors[:5]:
+        print(f"Warning: GitHub GraphQL error: {error.get('message', error)}")
+    if len(errors) > 5:
+        print(f"Warning: ... and {len(errors) - 5} more GitHub GraphQL errors")
+
+
+def gh_graphql(query: str, variables: Optional[Dict[str, str]] = None,
+               timeout: int = 30) -> Optional[Dict]:
+    """
+    Run a GraphQL query (direct API request, `gh api graphql` as fallback).
+
+    Errors reported in the response (e.g. a PR number that does not exist)
+    are printed; the data of the rest of the query is still returned.
+
+    Args:
+        query: GraphQL query text
+        variables: String variables referenced by the query
+        timeout: Request timeout in seconds
+
+    Returns:
+        The "data" object of the response, or None on failure
+    """
+    variables = variables or {}
+    client = get_client()
+    if client:
+        try:
+            response = client.graphql(query, variables)
+            if response is not None:
+                _report_graphql_errors(response)
+                return response.get("data")
+        except Exception:
+            pass  # Fall back to gh
+
+    cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
+    for key, value in variables.items():
+        cmd += ["-f", f"{key}={value}"]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except Exception as e:
+        print(f"Warning: GitHub GraphQL request failed: {e}")
+        return None
+
+    # gh exits non-zero when *any* aliased PR is missing, but still prints
+    # the partial data for the others — so parse stdout regardless
+    try:
+        response = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        print(f"Warning: GitHub GraphQL request failed: {result.stderr.strip()}")
+        return None
+
+    _report_graphql_errors(response)
+    return response.get("data")
+
+
+def _query_prs(repo: str, prs: List[int], fields: str, page_size: int) -> Iterator[Dict]:
+    """
+    Query many PRs with aliased pullRequest fields, one request per page.
+
+    Yields:
+        The node of each PR that was found
+    """
+    owner, name = repo.split("/", 1)
+    variables = {"owner": owner, "name": name}
+
+    for start in range(0, len(prs), page_size):
+        page = prs[start:start + page_size]
+        aliases = "\n".join(
+            f"pr{n}: pullRequest(number: {n}) {{ {fields} }}"
+            for n in page
+        )
+        query = (
+            "query($owner: String!, $name: String!) {\n"
+            f"repository(owner: $owner, name: $name) {{\n{aliases}\n}} }}"
+        )
+
+        data = gh_graphql(query, variables)
+        if not data or not data.get("repository"):
+            continue
+
+        for node in data["repository"].values():
+            if node:
+                yield node
+
+
+def fetch_prs_metadata(repo: str, prs: List[int], with_files: bool = False) -> Dict[int, Dict]:
+    """
+    Fetch metadata for many PRs in one GraphQL request per page.
+
+    The result uses the same shape as `gh pr view --json`, so callers can
+    swap a per-PR `gh pr view` loop for this without other changes:
+
+      {"number", "title", "url", "mergedAt", "additions", "deletions",
+       "author": {"login"}, "mergeCommit": {"oid"} | None,
+       "commits": <count>, "files": [{"path"}, ...]  # with_files only}
+
+    Args:
+        repo: GitHub repo (owner/name)
+        prs: PR numbers
+        with_files: Also fetch the changed file paths (first 100 per PR)
+
+    Returns:
+        Dict mapping PR number -> metadata, in the order of prs. PRs that
+        are not found are omitted.
+    """
+    fields = PR_METADATA_FIELDS + (" " + PR_FILES_FIELD if with_files else "")
+    found = {}
+
+    for node in _query_prs(repo, prs, fields, GRAPHQL_METADATA_PAGE_SIZE):
+        node["commits"] = (node.get("commits") or {}).get("totalCount", 0)
+        if with_files:
+            node["files"] = (node.get("files") or {}).get("nodes", [])
+        found[node["number"]] = node
+
+    return {pr: found[pr] for pr in prs if pr in found}
+
+
+def fetch_pr_shas(repo: str, prs: List[int]) -> Dict[int, str]:
+    """
+    Fetch the merge commit SHA for many PRs in one GraphQL request per page.
+
+    Args:
+        repo: GitHub repo (owner/name)
+        prs: PR numbers
+
+    Returns:
+        Dict mapping PR number -> merge commit SHA, ordered by merge time
+        (oldest first). PRs that are not found or not merged are omitted.
+    """
+    merged = []
+
+    for node in _query_prs(repo, prs, "number mergedAt mergeCommit { oid }", GRAPHQL_PAGE_SIZE):
+        if node.get("mergeCommit"):
+            merged.append((node["mergedAt"] or "", node["number"], node["mergeCommit"]["oid"]))
+
+    merged.sort()
+    return {number: oid for _, number, oid in merged}
@@ -23,6 +23,7 @@ Unlike PR-level decisions, this resolves actual code conflicts.
 import json
 import re
 import subprocess
+import sys
 import time
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
@@ -30,9 +31,6 @@ from dataclasses import dataclass
 from enum import Enum
 
 # Import LLM provider functions
-import sys
-script_dir = Path(__file__).parent
-sys.path.insert(0, str(script_dir))
 from llm_providers import (
     _call_openai,
     _call_gemini,
@@ -40,6 +38,7 @@ from llm_providers import (
     _call_azureopenai,
     _call_generic
 )
+from utils import append_jsonl, unmerged_files
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -450,16 +449,7 @@ class LLMConflictResolver:
     
     def detect_conflicted_files(self) -> List[str]:
         """Detect files with merge conflicts."""
-        result = subprocess.run(
-            ["git", "diff", "--name-only", "--diff-filter=U"],
-            capture_output=True, text=True
-        )
-        
-        if result.returncode != 0:
-            return []
-        
-        files = [f.strip() for f in result.stdout.strip().split('\n') if f.strip()]
-        return files
+        return unmerged_files()
     
     def parse_conflicts(self, file_path: str) -> List[ConflictBlock]:
         """Parse conflict markers in a file."""
@@ -604,25 +594,26 @@ class LLMConflictResolver:
         
         if llm_needed_conflicts:
             # Build conflict details for LLM
-            conflict_details = ""
+            parts = []
             for conflict in llm_needed_conflicts:
-                conflict_details += f"\n### Conflict {conflict.conflict_index+1} (Lines {conflict.start_line}-{conflict.end_line})\n"
-                conflict_details += f"**Classification**: {conflict.change_type.value} ({conflict.confidence.value} confidence)\n\n"
-                conflict_details += "**OURS (current branch)**:\n```\n"
-                conflict_details += conflict.ours_content[:500] + ("\n...(truncated)" if len(conflict.ours_content) > 500 else "")
-                conflict_details += "\n```\n\n"
-                conflict_details += "**THEIRS (incoming change)**:\n```\n"
-                conflict_details += conflict.theirs_content[:500] + ("\n...(truncated)" if len(conflict.theirs_content) > 500 else "")
-                conflict_details += "\n```\n"
+                parts.append(f"\n### Conflict {conflict.conflict_index+1} (Lines {conflict.start_line}-{conflict.end_line})\n")
+                parts.append(f"**Classification**: {conflict.change_type.value} ({conflict.confidence.value} confidence)\n\n")
+                parts.append("**OURS (current branch)**:\n```\n")
+                parts.append(conflict.ours_content[:500] + ("\n...(truncated)" if len(conflict.ours_content) > 500 else ""))
+                parts.append("\n```\n\n")
+                parts.append("**THEIRS (incoming change)**:\n```\n")
+                parts.append(conflict.theirs_content[:500] + ("\n...(truncated)" if len(conflict.theirs_content) > 500 else ""))
+                parts.append("\n```\n")
                 
                 # Add safety guidance for MEDIUM confidence
                 if conflict.confidence == Confidence.MEDIUM:
                     ours_safe = detect_safety_improvement(conflict.ours_content.split('\n'))
                     theirs_safe = detect_safety_improvement(conflict.theirs_content.split('\n'))
                     if theirs_safe and not ours_safe:
-                        conflict_details += "\n**SAFETY NOTE**: THEIRS adds safety improvements (prefer THEIRS or BOTH)\n"
+                        parts.append("\n**SAFETY NOTE**: THEIRS adds safety improvements (prefer THEIRS or BOTH)\n")
                     elif ours_safe and not theirs_safe:
-                        conflict_details += "\n**SAFETY NOTE**: OURS has safety improvements (prefer OURS or BOTH)\n"
+                        parts.append("\n**SAFETY NOTE**: OURS has safety improvements (prefer OURS or BOTH)\n")
+            conflict_details = "".join(parts)
             
             # Build prompt
             prompt = CONFLICT_RESOLUTION_PROMPT.format(
@@ -814,17 +805,22 @@ class LLMConflictResolver:
             "provider": self.provider
         }
         
-        with open(self.resolution_log, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        append_jsonl(self.resolution_log, entry)
     
-    def resolve_all_conflicts(self, pr_number: int, pr_metadata: Dict, operation: str = "cherry-pick") -> bool:
+    def resolve_all_conflicts(self, pr_number: int, pr_metadata: Dict, operation: str = "cherry-pick",
+                              conflicted_files: List[str] = None) -> bool:
         """
         Resolve all conflicts for the current git operation.
         
+        Args:
+            conflicted_files: Conflicted files, if the caller already detected
+                them (skips a second `git status`)
+        
         Returns:
             True if all conflicts were successfully resolved
         """
-        conflicted_files = self.detect_conflicted_files()
+        if conflicted_files is None:
+            conflicted_files = self.detect_conflicted_files()
         
         if not conflicted_files:
             print(f"  ℹ️  No conflicted files detected")
@@ -844,7 +840,7 @@ class LLMConflictResolver:
 # CLI for testing
 if __name__ == "__main__":
     import argparse
-    import yaml
+    from release_config import load_config
     
     parser = argparse.ArgumentParser()
     parser.add_argument("--config", required=True, help="Path to .release-config.yml")
@@ -853,8 +849,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
     
     # Load config
-    with open(args.config) as f:
-        config = yaml.safe_load(f)
+    config = load_config(args.config)
     
     # Create resolver
     resolver = LLMConflictResolver(config)
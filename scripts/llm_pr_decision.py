@@ -21,19 +21,22 @@ Decision Criteria:
   5. Strategy alignment: Does this align with include/exclude strategy?
 """
 
+import asyncio
 import json
 import time
 import hashlib
-import subprocess
+import re
+import sys
+import threading
+from collections import Counter
+from collections.abc import Mapping
 from typing import List, Dict, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 
 # Import LLM provider functions
-import sys
-script_dir = Path(__file__).parent
-sys.path.insert(0, str(script_dir))
 from llm_providers import (
     _call_openai,
     _call_gemini,
@@ -41,13 +44,36 @@ from llm_providers import (
     _call_azureopenai,
     _call_generic
 )
+from utils import (
+    HEAVY_RULE, USER_CACHE_DIR, append_jsonl, make_cache_dir, prune_diff, read_json, write_json
+)
+
+
+# Decision vocabulary. PRDecision interns its decision on creation, so it is
+# always the same object as one of these constants and `==` against them
+# resolves on CPython's identity fast path without comparing characters.
+INCLUDE = sys.intern("INCLUDE")
+EXCLUDE = sys.intern("EXCLUDE")
+MANUAL_REVIEW = sys.intern("MANUAL_REVIEW")
+DECISIONS = (INCLUDE, EXCLUDE, MANUAL_REVIEW)
+
+# Documentation files. A PR that changes only these and is not part of a
+# critical conflict is included by rule, without an LLM call.
+DOCS_ONLY_FILE = re.compile(r"\.(md|rst|txt)$", re.IGNORECASE)
+
+# Persistent verdict cache (private per-user directory; the "v1" is the
+# cache format version). Entries older than LLM_CACHE_MAX_AGE_DAYS are
+# dropped on save, and only the newest LLM_CACHE_MAX_ENTRIES are kept.
+LLM_CACHE_FILE = USER_CACHE_DIR / "llm_cache.v1.json"
+LLM_CACHE_MAX_AGE_DAYS = 30
+LLM_CACHE_MAX_ENTRIES = 1000
 
 
 @dataclass
 class PRDecision:
     """LLM decision for a single PR."""
     pr_number: int
-    decision: str  # "INCLUDE", "EXCLUDE", "MANUAL_REVIEW"
+    decision: str  # INCLUDE, EXCLUDE or MANUAL_REVIEW (interned)
     confidence: str  # "HIGH", "MEDIUM", "LOW"
     rationale: str
     requires_prs: List[int]  # Additional PRs needed if included
@@ -57,6 +83,51 @@ class PRDecision:
     provider: str
     elapsed_seconds: float
 
+    def __post_init__(self):
+        self.decision = sys.intern(self.decision)
+
+
+# PRDecision fields recorded in the feedback log, read in one C-level call
+_get_logged_fields = attrgetter("decision", "confidence", "rationale")
+
+
+class DecisionView(Mapping):
+    """
+    Read-only view of PRDecisions in the report's dict shape.
+
+    Keys are PR numbers as strings (as in the JSON artifacts). Each value is
+    built with asdict() only when it is accessed, so a report that only
+    needs counts or membership never copies the decisions.
+    """
+
+    def __init__(self, decisions: Dict[int, PRDecision]):
+        self._decisions = decisions
+
+    def _pr(self, key) -> int:
+        try:
+            return int(key)
+        except (TypeError, ValueError):
+            raise KeyError(key) from None
+
+    def __getitem__(self, key) -> Dict:
+        return asdict(self._decisions[self._pr(key)])
+
+    def __contains__(self, key) -> bool:
+        try:
+            return self._pr(key) in self._decisions
+        except KeyError:
+            return False
+
+    def __iter__(self):
+        return (str(pr) for pr in self._decisions)
+
+    def __len__(self) -> int:
+        return len(self._decisions)
+
+    def decision_counts(self) -> Counter:
+        """Number of decisions per verdict, read straight off the PRDecisions."""
+        return Counter(d.decision for d in self._decisions.values())
+
 
 # ── Prompt Templates ──────────────────────────────────────────────────────────
 
@@ -80,9 +151,19 @@ JSON Response Format:
   "benefits": ["Benefit 1", "Benefit 2"]  // Benefits of INCLUDING this PR
 }"""
 
-PR_DECISION_PROMPT = """## Release Strategy: {strategy}
+# Stable release context — identical for every PR in a run, so it is sent
+# ahead of the per-PR prompt and its hash is part of the verdict cache key.
+RELEASE_CONTEXT_PROMPT = """## Release Strategy: {strategy}
 
-### PR to Evaluate
+### Current Release Plan
+- **Strategy**: {strategy}
+- **Target Version**: {version}
+- **Base Branch**: {base_branch}"""
+
+# Per-PR part of the prompt — sent after the release context prefix. The
+# most volatile content (conflicts, diff) is kept last so that a PR which only
+# gained commits since the previous run differs at the tail of the prompt.
+PR_DECISION_PROMPT = """### PR to Evaluate
 **PR #{pr_number}**: {pr_title}
 - **Author**: {pr_author}
 - **Merged**: {merged_at}
@@ -90,42 +171,154 @@ PR_DECISION_PROMPT = """## Release Strategy: {strategy}
 - **Files Modified**:
 {files_list}
 
+### Context: Other PRs in This Release
+{other_prs_context}
+
+**Task**: Decide whether PR #{pr_number} should be INCLUDED in this {version} release.
+
+**Consider**:
+1. Does this PR provide critical functionality needed for {version}?
+2. Can the detected conflicts be resolved by including/excluding other PRs?
+3. What are the risks of including this PR vs excluding it?
+4. Does this align with the {strategy} strategy?
+
+Respond with the JSON decision object.
+
+---
+
 ### Code Pattern Analysis
 {semantic_analysis}
 
+### Detected Conflicts
+{conflicts_info}
+
 ### PR Diff Summary
 ```diff
 {pr_diff}
-```
+```"""
 
-### Detected Conflicts
-{conflicts_info}
+# Delta re-evaluation — used when the PR prompt is mostly unchanged since the
+# previous run and only its tail differs (see LLMPRDecisionMaker.decide_pr).
+DELTA_DECISION_PROMPT = """### Re-evaluation of PR #{pr_number}: {pr_title}
 
-### Context: Other PRs in This Release
-{other_prs_context}
+You previously evaluated this PR for the {version} release. Since then,
+{unchanged_pct}% of the PR context is unchanged; only the content below is new.
 
-### Current Release Plan
-- **Strategy**: {strategy}
-- **Target Version**: {version}
-- **Base Branch**: {base_branch}
+### Previous Decision
+- **Decision**: {prev_decision} ({prev_confidence} confidence)
+- **Rationale**: {prev_rationale}
+- **Requires PRs**: {prev_requires}
 
----
+### Changed Context (tail of the PR prompt)
+{delta}
 
-**Task**: Decide whether PR #{pr_number} should be INCLUDED in this {version} release.
+---
 
-**Consider**:
-1. Does this PR provide critical functionality needed for {version}?
-2. Can the detected conflicts be resolved by including/excluding other PRs?
-3. What are the risks of including this PR vs excluding it?
-4. Does this align with the {strategy} strategy?
+**Task**: Re-decide whether PR #{pr_number} should be INCLUDED in this {version} release,
+keeping the previous decision unless the changed context justifies a different one.
 
 Respond with the JSON decision object."""
 
 
+# ── Delta cache helpers ───────────────────────────────────────────────────────
+
+DELTA_BLOCK_SIZE = 512       # Target characters per prompt block
+DELTA_MIN_JACCARD = 0.8      # Minimum block overlap for a delta re-evaluation
+
+
+def prompt_blocks(text: str, block_size: int = DELTA_BLOCK_SIZE) -> List[str]:
+    """
+    Partition a prompt into ~block_size character blocks.
+    
+    Blocks end at a paragraph boundary when one is reached after half a
+    block, otherwise at the first line boundary past block_size (diffs are
+    rarely split into paragraphs).
+    
+    Returns:
+        List of block texts in prompt order
+    """
+    blocks = []
+    current = []
+    current_len = 0
+    for line in text.split("\n"):
+        current.append(line)
+        current_len += len(line) + 1
+        if current_len >= block_size or (not line and current_len >= block_size // 2):
+            blocks.append("\n".join(current))
+            current = []
+            current_len = 0
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+def block_hashes(blocks: List[str]) -> List[str]:
+    """Short SHA-256 digest for each prompt block."""
+    return [hashlib.sha256(b.encode()).hexdigest()[:16] for b in blocks]
+
+
+def tail_delta_start(prev_hashes: List[str], new_hashes: List[str]) -> Optional[int]:
+    """
+    Decide whether a prompt can be re-evaluated as a delta of a previous one.
+    
+    A delta is possible when the block sets overlap by at least
+    DELTA_MIN_JACCARD and the changes are contiguous at the tail, i.e. the
+    previous prompt is (apart from its last, partially-filled block) a
+    prefix of the new one.
+    
+    Returns:
+        Index of the first changed block in new_hashes, or None if a full
+        evaluation is required
+    """
+    if not prev_hashes or not new_hashes or prev_hashes == new_hashes:
+        return None
+    
+    prev_set, new_set = set(prev_hashes), set(new_hashes)
+    jaccard = len(prev_set & new_set) / len(prev_set | new_set)
+    if jaccard < DELTA_MIN_JACCARD:
+        return None
+    
+    common = 0
+    for old, new in zip(prev_hashes, new_hashes):
+        if old != new:
+            break
+        common += 1
+    
+    if common < len(prev_hashes) - 1 or common >= len(new_hashes):
+        return None
+    return common
+
+
+class _RateLimiter:
+    """Thread-safe limiter spacing calls at least 1/rate seconds apart."""
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until the caller may make its next call."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class LLMPRDecisionMaker:
     """LLM-powered decision maker for PR inclusion/exclusion."""
     
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, use_cache: bool = True):
+        """
+        Args:
+            config: Release config (the "llm" section configures the provider)
+            use_cache: Set False to neither read nor save verdicts cached
+                across runs
+        """
         llm_cfg = config.get("llm", {})
         
         if not llm_cfg.get("enabled"):
@@ -136,6 +329,10 @@ class LLMPRDecisionMaker:
         self.temperature = llm_cfg.get("temperature", 0.2)  # Higher for strategic decisions
         self.timeout = llm_cfg.get("timeout_seconds", 60)  # Longer for complex analysis
         self.max_calls = llm_cfg.get("max_calls_per_run", 50)
+        self.use_async = llm_cfg.get("async", True)  # Concurrent decide_prs()
+        self.max_concurrency = max(1, int(llm_cfg.get("max_concurrency", 8)))  # 0 would hang decide_prs
+        self.prefilter = llm_cfg.get("prefilter", True)  # Rule-based shortcut for obvious PRs
+        self._rate_limiter = _RateLimiter(llm_cfg.get("rps", 10))  # LLM requests/second
         
         # Get API key
         api_key_env = llm_cfg.get("api_key_env", "OPENAI_API_KEY")
@@ -150,15 +347,55 @@ class LLMPRDecisionMaker:
         self.strategy = config.get("strategy", "unknown")
         self.version = config.get("version", "unknown")
         self.base_branch = config.get("base_branch", "develop")
+        self.component = config.get("component_name", "unknown")
         
-        # State
+        # State (guarded by _lock when decide_prs runs calls concurrently)
+        self._lock = threading.RLock()
         self._call_count = 0
         self._decision_cache = {}
+        self._release_context_cache = None  # (prefix, sha256), built on first use
         self._feedback_log = Path("/tmp/rdkb-release-conflicts/llm_pr_decisions.jsonl")
         self._feedback_log.parent.mkdir(parents=True, exist_ok=True)
         
+        # Persistent cache across runs: full prompt hash -> verdict, plus the
+        # block hashes of the last prompt per PR for delta re-evaluation
+        self._use_cache = use_cache
+        self._cache_dirty = False
+        self._persistent_cache = (self._load_cache() if use_cache
+                                  else {"verdicts": {}, "sessions": {}})
+        
         print(f"  🤖 LLM PR Decision Maker initialized: {self.provider}/{self.model}")
     
+    def _prefilter_decision(self, pr_number: int, pr_metadata: Dict,
+                            conflicts: List[Dict]) -> Optional[PRDecision]:
+        """
+        Decide obvious PRs by rule instead of asking the LLM.
+        
+        Returns:
+            INCLUDE for a documentation-only PR without critical conflicts,
+            None when the PR needs an LLM decision
+        """
+        files = pr_metadata.get("files_changed") or []
+        if not files or len(files) < pr_metadata.get("files_count", 0):
+            return None  # File list unknown or truncated
+        if not all(DOCS_ONLY_FILE.search(f) for f in files):
+            return None
+        if any(c.get("severity") == "critical" for c in conflicts):
+            return None
+        
+        return PRDecision(
+            pr_number=pr_number,
+            decision=INCLUDE,
+            confidence="HIGH",
+            rationale="Documentation-only change, included without LLM review",
+            requires_prs=[],
+            risks=[],
+            benefits=["Keeps documentation in sync with the release"],
+            model="rules",
+            provider="prefilter",
+            elapsed_seconds=0.0
+        )
+    
     def decide_pr(self,
                   pr_number: int,
                   pr_metadata: Dict,
@@ -180,45 +417,35 @@ class LLMPRDecisionMaker:
         Returns:
             PRDecision if successful, None if failed
         """
-        # Check cache
-        cache_key = hashlib.md5(
-            f"{pr_number}|{self.strategy}|{self.version}".encode()
-        ).hexdigest()
-        
-        if cache_key in self._decision_cache:
-            print(f"    📋 Using cached decision for PR #{pr_number}")
-            return self._decision_cache[cache_key]
-        
-        # Rate limit check
-        if self._call_count >= self.max_calls:
-            print(f"    ⚠️  LLM rate limit reached ({self.max_calls} calls)")
-            return None
-        
-        self._call_count += 1
+        if self.prefilter:
+            decision = self._prefilter_decision(pr_number, pr_metadata, conflicts)
+            if decision:
+                print(f"    📋 PR #{pr_number}: {decision.rationale}")
+                self._log_decision(pr_number, decision, "prefilter", "", 0.0)
+                return decision
         
         # Build prompt context
         files_list = "\n".join([f"  - {f}" for f in pr_metadata.get("files_changed", [])])
         
         # Format conflicts info
         if conflicts:
-            conflicts_info = "**Detected Issues**:\n"
+            parts = ["**Detected Issues**:\n"]
             for c in conflicts:
-                conflicts_info += f"- {c['severity'].upper()}: {c['reason']}\n"
+                parts.append(f"- {c['severity'].upper()}: {c['reason']}\n")
                 if c.get('shared_files'):
-                    conflicts_info += f"  Files: {', '.join(c['shared_files'][:3])}\n"
+                    parts.append(f"  Files: {', '.join(c['shared_files'][:3])}\n")
                 if c.get('conflicting_with'):
-                    conflicts_info += f"  Conflicts with PRs: {c['conflicting_with']}\n"
+                    parts.append(f"  Conflicts with PRs: {c['conflicting_with']}\n")
+            conflicts_info = "".join(parts)
         else:
             conflicts_info = "No conflicts detected. This PR appears safe to include."
         
-        # Format other PRs context
-        other_prs = [p for p in all_prs_metadata.values() if p['number'] != pr_number]
-        if other_prs:
-            other_prs_context = "**Other PRs being processed**:\n"
-            for p in other_prs[:10]:  # Limit to first 10 for context length
-                other_prs_context += f"- PR #{p['number']}: {p.get('title', 'N/A')}\n"
-        else:
-            other_prs_context = "This is the only PR being evaluated."
+        # Drop lock/generated/binary file diffs and collapse huge hunks
+        pruned_diff = prune_diff(pr_diff)
+        saved = len(pr_diff.encode()) - len(pruned_diff.encode())
+        if saved > 0:
+            print(f"    ✂️  Pruned diff for PR #{pr_number}: {saved:,} bytes saved")
+        pr_diff = pruned_diff
         
         # Truncate diff if too long (keep first 200 lines)
         diff_lines = pr_diff.split('\n')
@@ -257,6 +484,17 @@ class LLMPRDecisionMaker:
         else:
             semantic_analysis = "**Code analysis not available** (diff could not be analyzed)"
         
+        # Format other PRs context
+        other_prs = [p for p in all_prs_metadata.values() if p['number'] != pr_number]
+        if other_prs:
+            other_prs_context = "**Other PRs being processed**:\n" + "".join(
+                f"- PR #{p['number']}: {p.get('title', 'N/A')}\n"
+                for p in other_prs[:10]  # Limit to first 10 for context length
+            )
+        else:
+            other_prs_context = "This is the only PR being evaluated."
+        
+        prefix, prefix_hash = self._release_context()
         prompt = PR_DECISION_PROMPT.format(
             strategy=self.strategy.upper(),
             pr_number=pr_number,
@@ -271,37 +509,99 @@ class LLMPRDecisionMaker:
             conflicts_info=conflicts_info,
             semantic_analysis=semantic_analysis,
             other_prs_context=other_prs_context,
-            version=self.version,
-            base_branch=self.base_branch
+            version=self.version
         )
         
+        # Tier 1: full request hash — keyed on the model and the hashes of the
+        # stable prefix and the per-PR suffix, so a changed diff, release
+        # context or model is re-evaluated. Checked in memory first, then
+        # across runs on disk.
+        cache_key = (f"{self.provider}/{self.model}:{prefix_hash}:"
+                     f"{hashlib.sha256(prompt.encode()).hexdigest()}")
+        session_key = f"{self.component}|{self.version}|{pr_number}"
+        
+        with self._lock:
+            if cache_key in self._decision_cache:
+                print(f"    📋 Using cached decision for PR #{pr_number}")
+                return self._decision_cache[cache_key]
+            
+            cached = self._persistent_cache["verdicts"].get(cache_key)
+            if cached:
+                print(f"    📋 Using cached decision for PR #{pr_number} (previous run)")
+                decision = PRDecision(**cached["verdict"])
+                self._decision_cache[cache_key] = decision
+                return decision
+            
+            # Rate limit check
+            if self._call_count >= self.max_calls:
+                print(f"    ⚠️  LLM rate limit reached ({self.max_calls} calls)")
+                return None
+            
+            self._call_count += 1
+            session = self._persistent_cache["sessions"].get(session_key)
+        
+        # Tier 2: mostly-unchanged prompt with tail-contiguous changes —
+        # send only the changed tail plus the previous verdict
+        blocks = prompt_blocks(prompt)
+        hashes = block_hashes(blocks)
+        
+        delta_start = None
+        if session and session.get("prefix_hash") == prefix_hash:
+            delta_start = tail_delta_start(session.get("blocks", []), hashes)
+        
+        if delta_start is not None:
+            prev = session["verdict"]
+            unchanged_pct = int(100 * delta_start / len(hashes))
+            print(f"    🔁 Delta re-evaluation for PR #{pr_number} "
+                  f"({unchanged_pct}% of prompt unchanged)")
+            user_prompt = DELTA_DECISION_PROMPT.format(
+                pr_number=pr_number,
+                pr_title=pr_metadata.get("title", "N/A"),
+                version=self.version,
+                unchanged_pct=unchanged_pct,
+                prev_decision=prev.get("decision"),
+                prev_confidence=prev.get("confidence"),
+                prev_rationale=prev.get("rationale", ""),
+                prev_requires=prev.get("requires_prs", []),
+                delta="\n".join(blocks[delta_start:])
+            )
+        else:
+            # Tier 3: full evaluation
+            user_prompt = prompt
+        
         # Call LLM
+        self._rate_limiter.acquire()
         t0 = time.time()
         try:
             if self.provider == "openai":
                 response = _call_openai(
-                    self.api_key, self.model, SYSTEM_PROMPT, prompt,
-                    self.temperature, self.timeout
+                    self.api_key, self.model, SYSTEM_PROMPT, user_prompt,
+                    self.temperature, self.timeout,
+                    prefix=prefix
                 )
             elif self.provider == "githubcopilot":
                 response = _call_githubcopilot(
-                    self.api_key, self.model, SYSTEM_PROMPT, prompt,
-                    self.temperature, self.timeout
+                    self.api_key, self.model, SYSTEM_PROMPT, user_prompt,
+                    self.temperature, self.timeout,
+                    prefix=prefix
                 )
             elif self.provider == "gemini":
                 response = _call_gemini(
-                    self.api_key, self.model, SYSTEM_PROMPT, prompt,
-                    self.temperature, self.timeout
+                    self.api_key, self.model, SYSTEM_PROMPT, user_prompt,
+                    self.temperature, self.timeout,
+                    prefix=prefix
                 )
             elif self.provider == "azureopenai":
                 response = _call_azureopenai(
-                    self.api_key, self.model, SYSTEM_PROMPT, prompt,
-                    self.temperature, self.timeout, self.endpoint
+                    self.api_key, self.model, SYSTEM_PROMPT, user_prompt,
+                    self.temperature, self.timeout, self.endpoint,
+                    prefix=prefix
                 )
             else:
                 response = _call_generic(
-                    self.api_key, self.model, SYSTEM_PROMPT, prompt,
-                    self.temperature, self.timeout, self.endpoint
+                    self.api_key, self.model, SYSTEM_PROMPT, user_prompt,
+                    self.temperature, self.timeout, self.endpoint,
+                    prefix=prefix
                 )
         except Exception as e:
             elapsed = time.time() - t0
@@ -328,7 +628,7 @@ class LLMPRDecisionMaker:
                 raise ValueError(f"Missing required fields: {required}")
             
             # Validate decision value
-            if decision_data["decision"] not in ["INCLUDE", "EXCLUDE", "MANUAL_REVIEW"]:
+            if decision_data["decision"] not in DECISIONS:
                 raise ValueError(f"Invalid decision: {decision_data['decision']}")
             
             # Create decision object
@@ -345,8 +645,24 @@ class LLMPRDecisionMaker:
                 elapsed_seconds=elapsed
             )
             
-            # Cache the decision
-            self._decision_cache[cache_key] = decision
+            # Cache the decision (in memory, and for subsequent runs once
+            # save_cache() writes the file). Serialized once; both cache
+            # entries share the same dict
+            verdict = asdict(decision)
+            cached_at = time.time()
+            with self._lock:
+                self._decision_cache[cache_key] = decision
+                self._persistent_cache["verdicts"][cache_key] = {
+                    "cached_at": cached_at,
+                    "verdict": verdict
+                }
+                self._persistent_cache["sessions"][session_key] = {
+                    "cached_at": cached_at,
+                    "prefix_hash": prefix_hash,
+                    "blocks": hashes,
+                    "verdict": verdict
+                }
+                self._cache_dirty = True
             
             # Log for feedback
             self._log_decision(pr_number, decision, "success", "", elapsed)
@@ -363,16 +679,121 @@ class LLMPRDecisionMaker:
             self._log_decision(pr_number, None, "validation_error", str(e), elapsed)
             return None
     
+    def decide_prs(self, requests: List[Dict]) -> Dict[int, Optional[PRDecision]]:
+        """
+        Decide on several PRs, running the LLM calls concurrently.
+        
+        The provider calls are blocking HTTP requests, so they run in worker
+        threads (at most llm.max_concurrency at a time, default 8), started
+        no faster than llm.rps per second (default 10). Progress is printed
+        as each decision completes, and a PR whose evaluation raises is
+        reported as failed without aborting the others. Set llm.async: false
+        to evaluate the PRs one by one instead. New verdicts are saved to the
+        persistent cache once, after all PRs are decided.
+        
+        Args:
+            requests: One dict of decide_pr() keyword arguments per PR
+            
+        Returns:
+            Dict mapping PR number -> PRDecision (None if that decision failed)
+        """
+        if not self.use_async or len(requests) <= 1:
+            decisions = {req["pr_number"]: self.decide_pr(**req) for req in requests}
+            self.save_cache()
+            return decisions
+        return asyncio.run(self.decide_prs_async(requests))
+    
+    async def decide_prs_async(self, requests: List[Dict]) -> Dict[int, Optional[PRDecision]]:
+        """Async form of decide_prs() for callers already inside an event loop."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def bounded(req):
+            pr_number = req["pr_number"]
+            async with semaphore:
+                try:
+                    return pr_number, await asyncio.to_thread(self.decide_pr, **req)
+                except Exception as e:
+                    print(f"    ❌ Decision failed for PR #{pr_number}: {e}")
+                    return pr_number, None
+        
+        decisions = {}
+        total = len(requests)
+        for done, task in enumerate(asyncio.as_completed([bounded(req) for req in requests]), 1):
+            pr_number, decision = await task
+            decisions[pr_number] = decision
+            outcome = decision.decision if decision else "Decision failed"
+            print(f"    [{done}/{total}] PR #{pr_number}: {outcome}")
+        
+        self.save_cache()
+        # Same order as the requests, regardless of completion order
+        return {req["pr_number"]: decisions[req["pr_number"]] for req in requests}
+    
+    def _load_cache(self) -> Dict:
+        """Load the persistent LLM decision cache (empty if missing/corrupt)."""
+        cache = {"verdicts": {}, "sessions": {}}
+        if LLM_CACHE_FILE.exists():
+            try:
+                data = read_json(LLM_CACHE_FILE)
+                cache["verdicts"] = data.get("verdicts", {})
+                cache["sessions"] = data.get("sessions", {})
+            except (json.JSONDecodeError, OSError, AttributeError):
+                pass
+        return cache
+    
+    def save_cache(self):
+        """
+        Persist new verdicts for subsequent runs (no-op if nothing changed
+        or caching is off). Expired entries are dropped and each section is
+        capped at LLM_CACHE_MAX_ENTRIES, newest first.
+        """
+        with self._lock:
+            if not (self._use_cache and self._cache_dirty):
+                return
+            cutoff = time.time() - LLM_CACHE_MAX_AGE_DAYS * 86400
+            for section in ("verdicts", "sessions"):
+                fresh = sorted(
+                    ((key, entry) for key, entry in self._persistent_cache[section].items()
+                     if entry.get("cached_at", 0) >= cutoff),
+                    key=lambda item: item[1]["cached_at"], reverse=True
+                )
+                self._persistent_cache[section] = dict(fresh[:LLM_CACHE_MAX_ENTRIES])
+            try:
+                make_cache_dir(LLM_CACHE_FILE.parent)
+                write_json(LLM_CACHE_FILE, self._persistent_cache, indent=False)
+                self._cache_dirty = False
+            except OSError as e:
+                print(f"    ⚠️  Could not save LLM cache: {e}")
+    
+    def _release_context(self) -> tuple:
+        """
+        Build (and memoize) the stable release-context prompt prefix.
+        
+        The prefix only depends on the release config, so it is rendered once
+        per run and reused verbatim for every PR.
+        
+        Returns:
+            (prefix, sha256 hex digest of prefix)
+        """
+        if self._release_context_cache is None:
+            prefix = RELEASE_CONTEXT_PROMPT.format(
+                strategy=self.strategy.upper(),
+                version=self.version,
+                base_branch=self.base_branch
+            )
+            self._release_context_cache = (prefix, hashlib.sha256(prefix.encode()).hexdigest())
+        return self._release_context_cache
+    
     def _log_decision(self, pr_number: int, decision: Optional[PRDecision],
                      status: str, error: str, elapsed: float):
         """Log decision for audit trail and feedback."""
+        verdict, confidence, rationale = _get_logged_fields(decision) if decision else (None, None, None)
         entry = {
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "pr_number": pr_number,
             "status": status,
-            "decision": decision.decision if decision else None,
-            "confidence": decision.confidence if decision else None,
-            "rationale": decision.rationale if decision else None,
+            "decision": verdict,
+            "confidence": confidence,
+            "rationale": rationale,
             "error": error,
             "elapsed_seconds": elapsed,
             "model": self.model,
@@ -381,62 +802,75 @@ class LLMPRDecisionMaker:
             "version": self.version
         }
         
-        with open(self._feedback_log, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        with self._lock:
+            append_jsonl(self._feedback_log, entry)
 
 
 # ── CLI for standalone testing ───────────────────────────────────────────────
 if __name__ == "__main__":
     import argparse
-    import yaml
+    from diff_cache import fetch_pr_diffs, get_prs_metadata
+    from pr_conflict_analyzer import index_conflicts_by_pr
+    from release_config import load_config
     
     parser = argparse.ArgumentParser()
     parser.add_argument("--config", required=True, help="Path to .release-config.yml")
-    parser.add_argument("--pr", required=True, type=int, help="PR number to evaluate")
+    parser.add_argument("--pr", required=True, type=int, nargs="+", help="PR number(s) to evaluate")
     parser.add_argument("--repo", required=True, help="GitHub repo (owner/name)")
     parser.add_argument("--conflicts", help="JSON file with conflict analysis")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached PR metadata, diffs and LLM verdicts")
     args = parser.parse_args()
     
     # Load config
-    with open(args.config) as f:
-        config = yaml.safe_load(f)
+    config = load_config(args.config)
     
     # Load conflicts if provided
     conflicts = []
     if args.conflicts and Path(args.conflicts).exists():
-        with open(args.conflicts) as f:
-            conflict_data = json.load(f)
-            conflicts = conflict_data.get("conflicts", {}).get("all", [])
-    
-    # Fetch PR metadata
-    result = subprocess.run(
-        ["gh", "pr", "view", str(args.pr), "--repo", args.repo,
-         "--json", "number,title,author,mergedAt,files,additions,deletions"],
-        capture_output=True, text=True
-    )
-    pr_metadata = json.loads(result.stdout)
+        conflict_data = read_json(args.conflicts)
+        conflicts = conflict_data.get("conflicts", {}).get("all", [])
     
-    # Get PR diff
-    diff_result = subprocess.run(
-        ["gh", "pr", "diff", str(args.pr), "--repo", args.repo],
-        capture_output=True, text=True
-    )
-    pr_diff = diff_result.stdout
+    # Fetch PR metadata (batched GraphQL) and diffs (concurrent, cached by SHA)
+    fetched = get_prs_metadata(args.repo, args.pr, with_files=True, use_cache=not args.no_cache)
+    all_prs_metadata = {}
+    for pr, data in fetched.items():
+        files = [f["path"] for f in data.get("files", [])]
+        all_prs_metadata[pr] = {
+            "number": pr,
+            "title": data.get("title", ""),
+            "author": (data.get("author") or {}).get("login", "unknown"),
+            "merged_at": data.get("mergedAt", ""),
+            "additions": data.get("additions", 0),
+            "deletions": data.get("deletions", 0),
+            "files_count": len(files),
+            "files_changed": files,
+        }
+    missing = [pr for pr in args.pr if pr not in all_prs_metadata]
+    if missing:
+        print(f"  ⚠️  Could not fetch PR(s): {missing}")
+    shas = {pr: (data.get("mergeCommit") or {}).get("oid") for pr, data in fetched.items()}
+    pr_diffs = fetch_pr_diffs(list(all_prs_metadata), repo=args.repo, shas=shas,
+                              use_cache=not args.no_cache)
     
-    # Make decision
-    decision_maker = LLMPRDecisionMaker(config)
-    decision = decision_maker.decide_pr(
-        args.pr,
-        pr_metadata,
-        pr_diff,
-        [c for c in conflicts if c["pr_number"] == args.pr],
-        {args.pr: pr_metadata}
-    )
+    # Make decisions (concurrently when several PRs are given)
+    conflicts_by_pr = index_conflicts_by_pr(conflicts)
+    decision_maker = LLMPRDecisionMaker(config, use_cache=not args.no_cache)
+    decisions = decision_maker.decide_prs([
+        {
+            "pr_number": pr,
+            "pr_metadata": all_prs_metadata[pr],
+            "pr_diff": pr_diffs[pr] or "",
+            "conflicts": conflicts_by_pr.get(pr, []),
+            "all_prs_metadata": all_prs_metadata
+        }
+        for pr in all_prs_metadata
+    ])
     
-    if decision:
-        print(f"\n  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-        print(f"  📋 Decision for PR #{decision.pr_number}")
-        print(f"  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    for decision in decisions.values():
+        if not decision:
+            continue
+        print(f"\n{HEAVY_RULE}\n  📋 Decision for PR #{decision.pr_number}\n{HEAVY_RULE}")
         print(f"  Decision: {decision.decision}")
         print(f"  Confidence: {decision.confidence}")
         print(f"  Rationale: {decision.rationale}")
@@ -12,11 +12,15 @@ This module provides unified API client functions for multiple LLM providers:
   - Generic OpenAI-compatible APIs (Ollama, vLLM, DeepSeek, etc.)
 
 All provider functions follow the same signature:
-  _call_<provider>(api_key, model, system, user, temperature, timeout, [endpoint])
+  _call_<provider>(api_key, model, system, user, temperature, timeout, [endpoint], prefix="")
   
   Returns: dict with {"content": str, "tokens": int}
   Raises: ConnectionError on API failures
 
+Prompt prefix:
+  ``prefix`` is the stable part of the user prompt (release context that is
+  identical across calls). It is always sent *before* ``user``.
+
 Used by:
   - llm_pr_decision.py (PR-level strategic decisions)
   - Future LLM-powered modules
@@ -35,10 +39,17 @@ Configuration (in .release-config.yml):
 import json
 
 
+def _join_prompt(prefix: str, user: str) -> str:
+    """Place the stable prompt prefix ahead of the per-call user prompt."""
+    if not prefix:
+        return user
+    return f"{prefix}\n\n{user}"
+
+
 # ── OpenAI ────────────────────────────────────────────────────────────────────
 
 def _call_openai(api_key: str, model: str, system: str, user: str,
-                 temperature: float, timeout: int) -> dict:
+                 temperature: float, timeout: int, prefix: str = "") -> dict:
     """
     Call OpenAI Chat Completions API.
     
@@ -49,6 +60,7 @@ def _call_openai(api_key: str, model: str, system: str, user: str,
         user: User prompt
         temperature: Sampling temperature (0.0-2.0)
         timeout: Request timeout in seconds
+        prefix: Stable prompt prefix sent ahead of the user prompt
         
     Returns:
         dict: {"content": str, "tokens": int}
@@ -63,7 +75,7 @@ def _call_openai(api_key: str, model: str, system: str, user: str,
         "model": model,
         "messages": [
             {"role": "system", "content": system},
-            {"role": "user", "content": user}
+            {"role": "user", "content": _join_prompt(prefix, user)}
         ],
         "temperature": temperature,
         "max_tokens": 2000,
@@ -91,7 +103,7 @@ def _call_openai(api_key: str, model: str, system: str, user: str,
 # ── Google Gemini ─────────────────────────────────────────────────────────────
 
 def _call_gemini(api_key: str, model: str, system: str, user: str,
-                 temperature: float, timeout: int) -> dict:
+                 temperature: float, timeout: int, prefix: str = "") -> dict:
     """
     Call Google Gemini API.
     
@@ -102,6 +114,7 @@ def _call_gemini(api_key: str, model: str, system: str, user: str,
         user: User prompt
         temperature: Sampling temperature (0.0-2.0)
         timeout: Request timeout in seconds
+        prefix: Stable prompt prefix sent ahead of the user prompt
         
     Returns:
         dict: {"content": str, "tokens": int}
@@ -114,7 +127,7 @@ def _call_gemini(api_key: str, model: str, system: str, user: str,
 
     payload = json.dumps({
         "system_instruction": {"parts": [{"text": system}]},
-        "contents": [{"parts": [{"text": user}]}],
+        "contents": [{"parts": [{"text": _join_prompt(prefix, user)}]}],
         "generationConfig": {
             "temperature": temperature,
             "maxOutputTokens": 2000,
@@ -143,7 +156,8 @@ def _call_gemini(api_key: str, model: str, system: str, user: str,
 # ── Azure OpenAI ──────────────────────────────────────────────────────────────
 
 def _call_azureopenai(api_key: str, model: str, system: str, user: str,
-                      temperature: float, timeout: int, endpoint: str) -> dict:
+                      temperature: float, timeout: int, endpoint: str,
+                      prefix: str = "") -> dict:
     """
     Call Azure OpenAI API (supports both OpenAI and Claude models via Azure).
     
@@ -155,6 +169,7 @@ def _call_azureopenai(api_key: str, model: str, system: str, user: str,
         temperature: Sampling temperature
         timeout: Request timeout in seconds
         endpoint: Azure endpoint URL (required)
+        prefix: Stable prompt prefix sent ahead of the user prompt
         
     Returns:
         dict: {"content": str, "tokens": int}
@@ -173,7 +188,7 @@ def _call_azureopenai(api_key: str, model: str, system: str, user: str,
             "model": model,
             "system": system,
             "messages": [
-                {"role": "user", "content": user}
+                {"role": "user", "content": _join_prompt(prefix, user)}
             ],
             "temperature": 0.7,
             "max_tokens": 2000,
@@ -189,7 +204,7 @@ def _call_azureopenai(api_key: str, model: str, system: str, user: str,
             "model": model,
             "messages": [
                 {"role": "system", "content": system},
-                {"role": "user", "content": user}
+                {"role": "user", "content": _join_prompt(prefix, user)}
             ],
             "temperature": temperature,
             "max_completion_tokens": 2000,
@@ -225,7 +240,7 @@ def _call_azureopenai(api_key: str, model: str, system: str, user: str,
 # ── GitHub Copilot ────────────────────────────────────────────────────────────
 
 def _call_githubcopilot(api_key: str, model: str, system: str, user: str,
-                        temperature: float, timeout: int) -> dict:
+                        temperature: float, timeout: int, prefix: str = "") -> dict:
     """
     Call GitHub Copilot API (GitHub Models).
     
@@ -236,6 +251,7 @@ def _call_githubcopilot(api_key: str, model: str, system: str, user: str,
         user: User prompt
         temperature: Sampling temperature
         timeout: Request timeout in seconds
+        prefix: Stable prompt prefix sent ahead of the user prompt
         
     Returns:
         dict: {"content": str, "tokens": int}
@@ -250,7 +266,7 @@ def _call_githubcopilot(api_key: str, model: str, system: str, user: str,
         "model": model,
         "messages": [
             {"role": "system", "content": system},
-            {"role": "user", "content": user}
+            {"role": "user", "content": _join_prompt(prefix, user)}
         ],
         "temperature": temperature,
         "max_tokens": 2000,
@@ -280,7 +296,8 @@ def _call_githubcopilot(api_key: str, model: str, system: str, user: str,
 # ── Generic OpenAI-Compatible API ────────────────────────────────────────────
 
 def _call_generic(api_key: str, model: str, system: str, user: str,
-                  temperature: float, timeout: int, endpoint: str) -> dict:
+                  temperature: float, timeout: int, endpoint: str,
+                  prefix: str = "") -> dict:
     """
     Call a generic OpenAI-compatible API endpoint.
     
@@ -295,6 +312,7 @@ def _call_generic(api_key: str, model: str, system: str, user: str,
         temperature: Sampling temperature
         timeout: Request timeout in seconds
         endpoint: API endpoint URL (required)
+        prefix: Stable prompt prefix sent ahead of the user prompt
         
     Returns:
         dict: {"content": str, "tokens": int}
@@ -309,7 +327,7 @@ def _call_generic(api_key: str, model: str, system: str, user: str,
         "model": model,
         "messages": [
             {"role": "system", "content": system},
-            {"role": "user", "content": user}
+            {"role": "user", "content": _join_prompt(prefix, user)}
         ],
         "temperature": temperature,
         "stream": False
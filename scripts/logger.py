@@ -17,9 +17,18 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+from utils import COLOR_ENABLED
+
+LOG_SEPARATOR = "=" * 60
+
 
 class ReleaseLogger:
-    """Structured logger for release operations."""
+    """
+    Structured logger for release operations.
+    
+    The level methods take logging's %-style arguments, which are only
+    formatted when a handler actually emits the record.
+    """
     
     def __init__(self, 
                  component_name: str,
@@ -62,8 +71,8 @@ class ReleaseLogger:
         console_handler.setFormatter(console_formatter)
         self.logger.addHandler(console_handler)
         
-        # File handler (detailed)
-        file_handler = logging.FileHandler(self.log_file, mode='w', encoding='utf-8')
+        # File handler (detailed); the file is created on the first record
+        file_handler = logging.FileHandler(self.log_file, mode='w', encoding='utf-8', delay=True)
         file_handler.setLevel(file_level)
         file_formatter = logging.Formatter(
             '%(asctime)s | %(levelname)-8s | %(funcName)-20s | %(message)s',
@@ -76,37 +85,36 @@ class ReleaseLogger:
         self.logger.info(f"Release agent started for {component_name} v{version}")
         self.logger.info(f"Log file: {self.log_file}")
     
-    def debug(self, msg: str) -> None:
+    def debug(self, msg: str, *args) -> None:
         """Log debug message."""
-        self.logger.debug(msg)
+        self.logger.debug(msg, *args)
     
-    def info(self, msg: str) -> None:
+    def info(self, msg: str, *args) -> None:
         """Log info message."""
-        self.logger.info(msg)
+        self.logger.info(msg, *args)
     
-    def warning(self, msg: str) -> None:
+    def warning(self, msg: str, *args) -> None:
         """Log warning message."""
-        self.logger.warning(msg)
+        self.logger.warning(msg, *args)
     
-    def error(self, msg: str) -> None:
+    def error(self, msg: str, *args) -> None:
         """Log error message."""
-        self.logger.error(msg)
+        self.logger.error(msg, *args)
     
-    def critical(self, msg: str) -> None:
+    def critical(self, msg: str, *args) -> None:
         """Log critical message."""
-        self.logger.critical(msg)
+        self.logger.critical(msg, *args)
     
     def section(self, title: str, level: str = "INFO") -> None:
         """Log a section header."""
-        separator = "=" * 60
         if level == "INFO":
-            self.logger.info(separator)
+            self.logger.info(LOG_SEPARATOR)
             self.logger.info(title)
-            self.logger.info(separator)
+            self.logger.info(LOG_SEPARATOR)
         elif level == "DEBUG":
-            self.logger.debug(separator)
+            self.logger.debug(LOG_SEPARATOR)
             self.logger.debug(title)
-            self.logger.debug(separator)
+            self.logger.debug(LOG_SEPARATOR)
     
     def get_log_file(self) -> Path:
         """Get the current log file path."""
@@ -127,7 +135,12 @@ class ColoredFormatter(logging.Formatter):
     RESET = '\033[0m'
     
     def format(self, record):
-        """Format log record with colors."""
+        """Format log record with colors (plain when colors are disabled)."""
+        if not COLOR_ENABLED:
+            return super().format(record)
+        # Color a copy: the record is shared with the file handler, which
+        # must not get escape codes
+        record = logging.makeLogRecord(record.__dict__)
         log_color = self.COLORS.get(record.levelname, self.RESET)
         record.levelname = f"{log_color}{record.levelname}{self.RESET}"
         return super().format(record)
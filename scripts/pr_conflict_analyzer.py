@@ -19,24 +19,21 @@ The LLM resolver then uses this information to make PR-level decisions:
   - Flag for manual review
 """
 
-import json
-import subprocess
 from typing import List, Dict, Set, Optional
 from dataclasses import dataclass
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-import sys
 
 # Import code pattern analyzer for semantic analysis
-script_dir = Path(__file__).parent
-sys.path.insert(0, str(script_dir))
 from code_pattern_analyzer import (
     analyze_pr_diff,
     SemanticAnalysis,
     ChangeType,
     get_pattern_hints
 )
+from diff_cache import fetch_pr_diffs, get_prs_metadata
+from utils import HEAVY_RULE, write_json
 
 
 @dataclass
@@ -82,30 +79,27 @@ class PRSemanticInfo:
 class PRConflictAnalyzer:
     """Rule-based analyzer for detecting PR-level conflicts."""
     
-    def __init__(self, repo: str):
+    def __init__(self, repo: str, use_diff_cache: bool = True):
         self.repo = repo
+        self.use_diff_cache = use_diff_cache
         self.pr_metadata: Dict[int, PRMetadata] = {}
         self.pr_semantic_info: Dict[int, PRSemanticInfo] = {}
         self.file_to_prs: Dict[str, Set[int]] = defaultdict(set)
         
     def fetch_pr_metadata(self, pr_numbers: List[int]) -> None:
-        """Fetch metadata for all specified PRs using GitHub CLI."""
+        """Fetch metadata for all specified PRs (batched GraphQL via GitHub CLI)."""
         print(f"  📋 Fetching metadata for {len(pr_numbers)} PRs...")
         
+        fetched = get_prs_metadata(self.repo, pr_numbers, with_files=True,
+                                   use_cache=self.use_diff_cache)
+        
         for pr_num in pr_numbers:
+            data = fetched.get(pr_num)
+            if data is None:
+                print(f"    ⚠️  Failed to fetch PR #{pr_num}")
+                continue
+            
             try:
-                # Fetch PR details including merge commit SHA
-                result = subprocess.run(
-                    ["gh", "pr", "view", str(pr_num), "--repo", self.repo,
-                     "--json", "number,title,author,mergedAt,files,additions,deletions,commits,mergeCommit"],
-                    capture_output=True, text=True, timeout=30
-                )
-                
-                if result.returncode != 0:
-                    print(f"    ⚠️  Failed to fetch PR #{pr_num}: {result.stderr}")
-                    continue
-                    
-                data = json.loads(result.stdout)
                 files = set(f["path"] for f in data.get("files", []))
                 
                 # Get merge commit SHA
@@ -115,7 +109,7 @@ class PRConflictAnalyzer:
                 metadata = PRMetadata(
                     number=data["number"],
                     title=data.get("title", ""),
-                    author=data.get("author", {}).get("login", "unknown"),
+                    author=(data.get("author") or {}).get("login", "unknown"),
                     merged_at=data.get("mergedAt", ""),
                     files_changed=files,
                     additions=data.get("additions", 0),
@@ -135,23 +129,27 @@ class PRConflictAnalyzer:
                       
             except Exception as e:
                 print(f"    ❌ Error fetching PR #{pr_num}: {e}")
-                
+    
     def detect_file_overlaps(self, pr_numbers: List[int]) -> List[PRConflictInfo]:
         """Detect PRs that modify the same files (potential conflicts)."""
         conflicts = []
         checked_pairs = set()
+        pr_set = set(pr_numbers)  # Built once, not per file
+        pr_metadata = self.pr_metadata
+        file_to_prs = self.file_to_prs
         
         for pr_num in pr_numbers:
-            if pr_num not in self.pr_metadata:
+            meta = pr_metadata.get(pr_num)
+            if meta is None:
                 continue
                 
-            pr_files = self.pr_metadata[pr_num].files_changed
+            pr_files = meta.files_changed
             conflicting_prs = set()
             
             # Find all other PRs that touch the same files
             for file in pr_files:
-                other_prs = self.file_to_prs[file] - {pr_num}
-                conflicting_prs.update(other_prs & set(pr_numbers))
+                conflicting_prs.update(file_to_prs[file] & pr_set)
+            conflicting_prs.discard(pr_num)
             
             # Create conflict records for each unique pair
             for other_pr in conflicting_prs:
@@ -160,7 +158,7 @@ class PRConflictAnalyzer:
                     continue
                 checked_pairs.add(pair)
                 
-                shared = pr_files & self.pr_metadata[other_pr].files_changed
+                shared = pr_files & pr_metadata[other_pr].files_changed
                 
                 # Determine severity based on number of shared files
                 if len(shared) >= 5:
@@ -186,12 +184,12 @@ class PRConflictAnalyzer:
         conflicts = []
         
         # Sort PRs by merge time
+        pr_metadata = self.pr_metadata
         pr_times = []
         for pr_num in pr_numbers:
-            if pr_num in self.pr_metadata:
-                merged_at = self.pr_metadata[pr_num].merged_at
-                if merged_at:
-                    pr_times.append((pr_num, merged_at))
+            meta = pr_metadata.get(pr_num)
+            if meta and meta.merged_at:
+                pr_times.append((pr_num, meta.merged_at))
         
         pr_times.sort(key=lambda x: x[1])
         
@@ -208,8 +206,8 @@ class PRConflictAnalyzer:
                 
                 if hours_diff <= 24 and hours_diff > 0:
                     # Check if they share files
-                    shared = (self.pr_metadata[pr1].files_changed & 
-                             self.pr_metadata[pr2].files_changed)
+                    shared = (pr_metadata[pr1].files_changed & 
+                             pr_metadata[pr2].files_changed)
                     
                     if shared:
                         conflicts.append(PRConflictInfo(
@@ -245,12 +243,15 @@ class PRConflictAnalyzer:
         critical_regexes = [re.compile(p) for p in critical_patterns]
         conflicts = []
         
+        pr_metadata = self.pr_metadata
+        
         for pr_num in pr_numbers:
-            if pr_num not in self.pr_metadata:
+            meta = pr_metadata.get(pr_num)
+            if meta is None:
                 continue
                 
             critical_files = []
-            for file in self.pr_metadata[pr_num].files_changed:
+            for file in meta.files_changed:
                 if any(regex.match(file) for regex in critical_regexes):
                     critical_files.append(file)
             
@@ -270,23 +271,23 @@ class PRConflictAnalyzer:
         """Analyze semantic patterns in PR diffs using code pattern analysis."""
         print(f"\n  🧬 Analyzing code patterns and semantics...")
         
+        pr_numbers = [pr_num for pr_num in pr_numbers if pr_num in self.pr_metadata]
+        
+        # Fetch all diffs up front, in parallel (cached on disk by merge commit SHA)
+        diffs = fetch_pr_diffs(
+            pr_numbers, repo=self.repo,
+            shas={pr_num: self.pr_metadata[pr_num].merge_commit_sha for pr_num in pr_numbers},
+            use_cache=self.use_diff_cache
+        )
+        
         for pr_num in pr_numbers:
-            if pr_num not in self.pr_metadata:
-                continue
-            
             try:
-                # Fetch PR diff using GitHub CLI
-                result = subprocess.run(
-                    ["gh", "pr", "diff", str(pr_num), "--repo", self.repo],
-                    capture_output=True, text=True, timeout=30
-                )
+                diff_text = diffs.get(pr_num)
                 
-                if result.returncode != 0:
+                if diff_text is None:
                     print(f"    ⚠️  Could not fetch diff for PR #{pr_num}")
                     continue
                 
-                diff_text = result.stdout
-                
                 # Analyze using code pattern analyzer
                 analysis: SemanticAnalysis = analyze_pr_diff(diff_text)
                 
@@ -318,7 +319,7 @@ class PRConflictAnalyzer:
         Returns a dictionary with all detected conflicts and metadata.
         """
         print(f"\n  🔍 PHASE 1: Rule-Based Conflict Detection")
-        print(f"  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(HEAVY_RULE)
         
         # Fetch metadata for all PRs
         self.fetch_pr_metadata(pr_numbers)
@@ -326,20 +327,28 @@ class PRConflictAnalyzer:
         # Analyze semantic patterns in PRs
         self.analyze_pr_semantics(pr_numbers)
         
-        # Run all detection methods
-        file_conflicts = self.detect_file_overlaps(pr_numbers)
-        timing_conflicts = self.detect_timing_conflicts(pr_numbers)
+        # Run all detection methods (overlap and timing compare PR pairs, so
+        # a single-PR release, e.g. a hotfix, skips them)
+        if len(pr_numbers) > 1:
+            file_conflicts = self.detect_file_overlaps(pr_numbers)
+            timing_conflicts = self.detect_timing_conflicts(pr_numbers)
+        else:
+            file_conflicts, timing_conflicts = [], []
         critical_conflicts = self.detect_critical_file_changes(pr_numbers)
         
-        # Aggregate results
-        all_conflicts = file_conflicts + timing_conflicts + critical_conflicts
+        # Aggregate results (each conflict converted to a dict once and shared
+        # by the "all", "by_severity" and "by_type" views)
+        file_dicts = [self._conflict_to_dict(c) for c in file_conflicts]
+        timing_dicts = [self._conflict_to_dict(c) for c in timing_conflicts]
+        critical_dicts = [self._conflict_to_dict(c) for c in critical_conflicts]
+        all_conflicts = file_dicts + timing_dicts + critical_dicts
         
-        # Group by severity
-        conflicts_by_severity = {
-            "critical": [c for c in all_conflicts if c.severity == "critical"],
-            "medium": [c for c in all_conflicts if c.severity == "medium"],
-            "low": [c for c in all_conflicts if c.severity == "low"]
-        }
+        # Group by severity (single pass)
+        conflicts_by_severity = {"critical": [], "medium": [], "low": []}
+        for c in all_conflicts:
+            bucket = conflicts_by_severity.get(c["severity"])
+            if bucket is not None:
+                bucket.append(c)
         
         print(f"\n  📊 Detection Summary:")
         print(f"    • File Overlaps: {len(file_conflicts)}")
@@ -349,6 +358,7 @@ class PRConflictAnalyzer:
         print(f"      - Critical: {len(conflicts_by_severity['critical'])}")
         print(f"      - Medium: {len(conflicts_by_severity['medium'])}")
         print(f"      - Low: {len(conflicts_by_severity['low'])}")
+        print(f"    • PRs Involved: {len(index_conflicts_by_pr(all_conflicts))}")
         
         return {
             "total_prs_analyzed": len(pr_numbers),
@@ -377,16 +387,12 @@ class PRConflictAnalyzer:
                 "summary": v.summary
             } for k, v in self.pr_semantic_info.items()},
             "conflicts": {
-                "all": [self._conflict_to_dict(c) for c in all_conflicts],
-                "by_severity": {
-                    "critical": [self._conflict_to_dict(c) for c in conflicts_by_severity["critical"]],
-                    "medium": [self._conflict_to_dict(c) for c in conflicts_by_severity["medium"]],
-                    "low": [self._conflict_to_dict(c) for c in conflicts_by_severity["low"]]
-                },
+                "all": all_conflicts,
+                "by_severity": conflicts_by_severity,
                 "by_type": {
-                    "file_overlap": [self._conflict_to_dict(c) for c in file_conflicts],
-                    "timing": [self._conflict_to_dict(c) for c in timing_conflicts],
-                    "critical_files": [self._conflict_to_dict(c) for c in critical_conflicts]
+                    "file_overlap": file_dicts,
+                    "timing": timing_dicts,
+                    "critical_files": critical_dicts
                 }
             }
         }
@@ -403,6 +409,28 @@ class PRConflictAnalyzer:
         }
 
 
+def index_conflicts_by_pr(conflicts: List[Dict]) -> Dict[int, List[Dict]]:
+    """
+    Index conflict dicts by every PR they involve.
+    
+    A conflict is listed under its own pr_number and under each PR in
+    conflicting_with, so per-PR lookups are O(1) instead of re-scanning
+    the full conflict list for every PR.
+    
+    Args:
+        conflicts: Conflict dicts (as in analyze()["conflicts"]["all"])
+        
+    Returns:
+        Dict mapping PR number -> conflicts involving that PR
+    """
+    conflicts_by_pr = defaultdict(list)
+    for conflict in conflicts:
+        conflicts_by_pr[conflict["pr_number"]].append(conflict)
+        for other_pr in conflict.get("conflicting_with", []):
+            conflicts_by_pr[other_pr].append(conflict)
+    return dict(conflicts_by_pr)
+
+
 # ── CLI for standalone testing ───────────────────────────────────────────────
 if __name__ == "__main__":
     import argparse
@@ -412,11 +440,13 @@ if __name__ == "__main__":
     parser.add_argument("--prs", required=True, help="Comma-separated PR numbers")
     parser.add_argument("--output", default="/tmp/pr_conflict_analysis.json",
                        help="Output JSON file")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Re-fetch PR diffs and metadata instead of using the on-disk cache")
     args = parser.parse_args()
     
     pr_numbers = [int(p.strip()) for p in args.prs.split(",")]
     
-    analyzer = PRConflictAnalyzer(args.repo)
+    analyzer = PRConflictAnalyzer(args.repo, use_diff_cache=not args.no_cache)
     results = analyzer.analyze(pr_numbers)
     
     # Save results
@@ -424,7 +454,6 @@ if __name__ == "__main__":
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, "w") as f:
-        json.dump(results, f, indent=2)
+    write_json(output_path, results, indent=False)  # Machine-read artifact; use jq to view
     
     print(f"\n  💾 Results saved to: {output_path}")
@@ -8,15 +8,52 @@ This module provides smart capabilities to:
   - Discover all PRs merged since the last tag
   - Identify PR dependencies based on code analysis
   - Validate user's include/exclude configuration
+  - Order PRs so prerequisites are applied before their dependents
   - Provide intelligent warnings and recommendations
+
+Discovery results are cached in the private per-user cache directory,
+keyed by the commit SHAs of the last tag and the base branch plus a format
+version, so repeated runs against unchanged history skip the git log scan:
+
+  ~/.cache/rdkb-release-agent/discovery/{tag_sha}-{base_sha}.v1.json
+
+Bump DISCOVERY_CACHE_VERSION whenever the PR parsing changes, so results
+produced by the old logic are not reused.
 """
 
+import heapq
 import re
 import subprocess
+from pathlib import Path
 from typing import List, Dict, Set, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from collections import defaultdict
 
+from utils import USER_CACHE_DIR, make_cache_dir, read_json, write_json
+
+
+DISCOVERY_CACHE_DIR = USER_CACHE_DIR / "discovery"
+DISCOVERY_CACHE_VERSION = 1   # Bump when PR parsing changes
+
+# PR reference patterns in commit subjects, most specific first
+PR_REFERENCE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'Merge pull request #(\d+)',      # GitHub merge commits
+    r'Merge PR #(\d+)',                # Short merge format
+    r'PR[:\s]#(\d+)',                  # PR #123: Title
+    r'\(#(\d+)\)',                     # Title (#123)
+    r'Closes[:\s]#(\d+)',              # Closes #123
+    r'Fixes[:\s]#(\d+)',               # Fixes #123
+    r'#(\d+)',                         # Generic #123 (fallback)
+)]
+
+# Stripped from the subject to leave the PR title
+PR_TITLE_NOISE = [re.compile(p) for p in (
+    r'Merge pull request #\d+\s+from\s+[\w\-/]+\s*',
+    r'Merge PR #\d+[:\s]*',                # Handle "Merge PR #XX:"
+    r'PR[:\s]#\d+[:\s]*',
+    r'\(#\d+\)',
+)]
+
 
 @dataclass
 class PRDiscoveryResult:
@@ -90,9 +127,33 @@ def get_commits_since_tag(tag: str, base_branch: str = "develop", repo_path: str
         return []
 
 
-def extract_pr_from_commit(commit_hash: str, repo_path: str = ".") -> Optional[Tuple[int, str]]:
+def get_commit_subjects_since_tag(tag: str, base_branch: str = "develop",
+                                  repo_path: str = ".") -> List[Tuple[str, str]]:
     """
-    Extract PR number and title from commit message.
+    Get the hash and subject of every commit since the tag, in one git call.
+    
+    Returns:
+        List of (commit hash, subject) tuples (newest first)
+    """
+    try:
+        result = subprocess.run(
+            ["git", "log", f"{tag}..{base_branch}", "--format=%H%x00%s"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        if result.returncode != 0:
+            return []
+        return [tuple(line.split("\0", 1)) for line in result.stdout.splitlines() if "\0" in line]
+    except Exception as e:
+        print(f"Warning: Could not get commits since {tag}: {e}")
+        return []
+
+
+def parse_pr_reference(commit_msg: str) -> Optional[Tuple[int, str]]:
+    """
+    Extract PR number and title from a commit subject.
     
     Common patterns:
       - "Merge pull request #123 from user/branch"
@@ -100,6 +161,27 @@ def extract_pr_from_commit(commit_hash: str, repo_path: str = ".") -> Optional[T
       - "(#789)"
       - "Closes #123"
       
+    Returns:
+        Tuple of (PR number, title) or None if no PR found
+    """
+    commit_msg = commit_msg.strip()
+    for pattern in PR_REFERENCE_PATTERNS:
+        match = pattern.search(commit_msg)
+        if match:
+            pr_num = int(match.group(1))
+            # Extract title (remove PR reference)
+            title = commit_msg
+            for noise in PR_TITLE_NOISE:
+                title = noise.sub('', title)
+            title = title.strip()
+            return (pr_num, title or commit_msg[:50])
+    return None
+
+
+def extract_pr_from_commit(commit_hash: str, repo_path: str = ".") -> Optional[Tuple[int, str]]:
+    """
+    Extract PR number and title from a commit's message (see parse_pr_reference).
+    
     Returns:
         Tuple of (PR number, title) or None if no PR found
     """
@@ -113,47 +195,47 @@ def extract_pr_from_commit(commit_hash: str, repo_path: str = ".") -> Optional[T
         )
         if result.returncode != 0:
             return None
-            
-        commit_msg = result.stdout.strip()
-        
-        # Try various PR patterns
-        patterns = [
-            r'Merge pull request #(\d+)',      # GitHub merge commits
-            r'Merge PR #(\d+)',                # Short merge format
-            r'PR[:\s]#(\d+)',                  # PR #123: Title
-            r'\(#(\d+)\)',                     # Title (#123)
-            r'Closes[:\s]#(\d+)',              # Closes #123
-            r'Fixes[:\s]#(\d+)',               # Fixes #123
-            r'#(\d+)',                         # Generic #123 (fallback)
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, commit_msg, re.IGNORECASE)
-            if match:
-                pr_num = int(match.group(1))
-                # Extract title (remove PR reference)
-                title = re.sub(r'Merge pull request #\d+\s+from\s+[\w\-/]+\s*', '', commit_msg)
-                title = re.sub(r'Merge PR #\d+[:\s]*', '', title)  # Handle "Merge PR #XX:"
-                title = re.sub(r'PR[:\s]#\d+[:\s]*', '', title)
-                title = re.sub(r'\(#\d+\)', '', title)
-                title = title.strip()
-                return (pr_num, title or commit_msg[:50])
-                
-        return None
+        return parse_pr_reference(result.stdout)
         
     except Exception as e:
         print(f"Warning: Could not extract PR from commit {commit_hash}: {e}")
         return None
 
 
+def _discovery_cache_file(last_tag: str, base_branch: str, repo_path: str) -> Optional[Path]:
+    """Cache file for a tag..branch range, keyed by both commit SHAs (None if unresolvable)."""
+    result = subprocess.run(
+        ["git", "rev-parse", f"{last_tag}^{{commit}}", f"{base_branch}^{{commit}}"],
+        cwd=repo_path, capture_output=True, text=True, timeout=10
+    )
+    if result.returncode != 0:
+        return None
+    tag_sha, base_sha = result.stdout.split()
+    return DISCOVERY_CACHE_DIR / f"{tag_sha}-{base_sha}.v{DISCOVERY_CACHE_VERSION}.json"
+
+
+def _load_cached_discovery(cache_file: Path) -> Optional[PRDiscoveryResult]:
+    try:
+        data = read_json(cache_file)
+        # JSON object keys are strings; PR numbers are ints
+        data["pr_commit_map"] = {int(k): v for k, v in data["pr_commit_map"].items()}
+        data["pr_titles"] = {int(k): v for k, v in data["pr_titles"].items()}
+        return PRDiscoveryResult(**data)
+    except Exception:
+        return None
+
+
 def discover_prs_since_tag(base_branch: str = "develop", 
-                           repo_path: str = ".") -> Optional[PRDiscoveryResult]:
+                           repo_path: str = ".",
+                           use_cache: bool = True) -> Optional[PRDiscoveryResult]:
     """
     Discover all PRs merged since the last tag.
     
     Args:
         base_branch: Branch to check for merged PRs
         repo_path: Path to git repository
+        use_cache: Reuse the cached result when neither the tag nor the
+            branch has moved (set False to force a fresh scan)
         
     Returns:
         PRDiscoveryResult with all discovered PRs, or None if error
@@ -164,8 +246,33 @@ def discover_prs_since_tag(base_branch: str = "develop",
         print("  ⚠️  No git tags found - cannot auto-discover PRs")
         return None
     
-    # Get commits since tag
-    commits = get_commits_since_tag(last_tag, base_branch, repo_path)
+    try:
+        cache_file = _discovery_cache_file(last_tag, base_branch, repo_path)
+    except Exception:
+        cache_file = None
+    
+    if use_cache and cache_file and cache_file.exists():
+        cached = _load_cached_discovery(cache_file)
+        if cached:
+            print(f"  📋 Using cached PR discovery for {last_tag}..{base_branch}")
+            return cached
+    
+    result = _scan_prs_since_tag(last_tag, base_branch, repo_path)
+    
+    if cache_file:
+        try:
+            make_cache_dir(DISCOVERY_CACHE_DIR)
+            write_json(cache_file, asdict(result), indent=False)
+        except OSError:
+            pass
+    
+    return result
+
+
+def _scan_prs_since_tag(last_tag: str, base_branch: str, repo_path: str) -> PRDiscoveryResult:
+    """Scan the commits between last_tag and base_branch for PR references."""
+    # Get commits since tag (hash and subject in a single git log)
+    commits = get_commit_subjects_since_tag(last_tag, base_branch, repo_path)
     if not commits:
         print(f"  ℹ️  No commits found since tag {last_tag}")
         return PRDiscoveryResult(
@@ -180,8 +287,8 @@ def discover_prs_since_tag(base_branch: str = "develop",
     pr_commit_map = {}
     pr_titles = {}
     
-    for commit in commits:
-        pr_info = extract_pr_from_commit(commit, repo_path)
+    for commit, subject in commits:
+        pr_info = parse_pr_reference(subject)
         if pr_info:
             pr_num, title = pr_info
             if pr_num not in pr_commit_map:  # Keep first (newest) occurrence
@@ -297,6 +404,107 @@ def validate_pr_dependencies(
     )
 
 
+def _kahn_order(prs: List[int], deps: Dict[int, List[int]]) -> Tuple[List[int], List[int]]:
+    """
+    Kahn's in-degree topological sort, O(V+E).
+    
+    Ready PRs are emitted in their original list position, so PRs without
+    dependencies between them keep the caller's order (e.g. merge order).
+    
+    Returns:
+        (ordered PRs, PRs left over because they are on or behind a cycle)
+    """
+    position = {pr: i for i, pr in enumerate(prs)}
+    in_degree = {pr: len(deps[pr]) for pr in prs}
+    dependents = defaultdict(list)  # Reverse adjacency: prerequisite -> dependents
+    for pr in prs:
+        for dep in deps[pr]:
+            dependents[dep].append(pr)
+    
+    ready = [(position[pr], pr) for pr in prs if in_degree[pr] == 0]
+    heapq.heapify(ready)
+    ordered = []
+    while ready:
+        _, pr = heapq.heappop(ready)
+        ordered.append(pr)
+        for dependent in dependents[pr]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                heapq.heappush(ready, (position[dependent], dependent))
+    
+    remaining = [pr for pr in prs if in_degree[pr] > 0]
+    return ordered, remaining
+
+
+def _strongly_connected_components(prs: List[int], deps: Dict[int, List[int]]) -> List[List[int]]:
+    """Tarjan's SCC algorithm over the PR dependency graph."""
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    components = []
+    
+    def visit(pr):
+        index[pr] = lowlink[pr] = len(index)
+        stack.append(pr)
+        on_stack.add(pr)
+        for dep in deps[pr]:
+            if dep not in index:
+                visit(dep)
+                lowlink[pr] = min(lowlink[pr], lowlink[dep])
+            elif dep in on_stack:
+                lowlink[pr] = min(lowlink[pr], index[dep])
+        if lowlink[pr] == index[pr]:
+            component = []
+            while True:
+                member = stack.pop()
+                on_stack.discard(member)
+                component.append(member)
+                if member == pr:
+                    break
+            components.append(sorted(component))
+    
+    for pr in prs:
+        if pr not in index:
+            visit(pr)
+    return components
+
+
+def order_prs_by_dependencies(prs: List[int],
+                              requires: Dict[int, List[int]]) -> Tuple[List[int], List[List[int]]]:
+    """
+    Order PRs so that every prerequisite PR comes before the PRs requiring it.
+    
+    Only dependencies between PRs in the list are considered. Dependencies
+    only ever reorder PRs, never drop them: if any PRs form a dependency
+    cycle, the cycles are reported and all PRs keep their default order.
+    
+    Args:
+        prs: PR numbers in their default processing order
+        requires: PR number -> PR numbers it requires (e.g. LLM requires_prs)
+        
+    Returns:
+        (ordered PRs, always all of them; list of cyclic components)
+    """
+    prs = list(dict.fromkeys(prs))
+    pr_set = set(prs)
+    deps = {
+        pr: [d for d in dict.fromkeys(requires.get(pr, [])) if d in pr_set and d != pr]
+        for pr in prs
+    }
+    
+    ordered, remaining = _kahn_order(prs, deps)
+    if not remaining:
+        return ordered, []
+    
+    # Cycles: report the cyclic components and fall back to the default order
+    cycles = [
+        scc for scc in _strongly_connected_components(remaining, deps)
+        if len(scc) > 1
+    ]
+    return prs, cycles
+
+
 def print_discovery_summary(discovery: PRDiscoveryResult,
                            configured_prs: List[int],
                            strategy: str) -> None:
@@ -309,23 +517,24 @@ def print_discovery_summary(discovery: PRDiscoveryResult,
     print(f"  Commits Since   : {discovery.commits_since_tag}")
     print(f"  PRs Found       : {len(discovery.all_prs)}")
     
+    configured_set = frozenset(configured_prs)
     if discovery.all_prs:
         print(f"\n  All PRs since {discovery.last_tag}:")
         for pr_num in discovery.all_prs:  # Show all PRs
             title = discovery.pr_titles.get(pr_num, "")[:60]
-            configured = "✓" if pr_num in configured_prs else " "
+            configured = "✓" if pr_num in configured_set else " "
             print(f"    [{configured}] PR #{pr_num}: {title}")
     
     # Show strategy summary
     print(f"\n  Strategy        : {c(BOLD, strategy.upper())}")
     if strategy == "include":
         print(f"  Configured      : {len(configured_prs)} PRs to INCLUDE")
-        not_in_config = len(set(discovery.all_prs) - set(configured_prs))
+        not_in_config = len(set(discovery.all_prs) - configured_set)
         if not_in_config > 0:
             print(f"  {c(YELLOW, f'⚠️  {not_in_config} PRs found but not in config')}")
     else:
         print(f"  Configured      : {len(configured_prs)} PRs to EXCLUDE")
-        will_include = len(set(discovery.all_prs) - set(configured_prs))
+        will_include = len(set(discovery.all_prs) - configured_set)
         print(f"  Will Include    : {will_include} PRs")
 
 
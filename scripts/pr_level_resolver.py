@@ -16,19 +16,19 @@ When a conflict occurs during cherry-pick/revert:
   - NO manual code merging at hunk level
 """
 
-import json
+import queue
+import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from pathlib import Path
 from dataclasses import dataclass
 
-# Import LLM conflict resolver
-sys.path.insert(0, str(Path(__file__).parent))
-try:
-    from llm_conflict_resolver import LLMConflictResolver
-except ImportError:
-    LLMConflictResolver = None
+from diff_cache import get_pr_diff
+from pr_conflict_analyzer import index_conflicts_by_pr
+from utils import HEAVY_RULE, USER_CACHE_DIR, append_jsonl, flush_writes, make_cache_dir, read_json, read_jsonl, unmerged_files, write_json_background
 
 
 @dataclass
@@ -43,7 +43,8 @@ class ResolutionAction:
 class PRLevelResolver:
     """Resolver that makes PR-level decisions (no code merging)."""
     
-    def __init__(self, mode: str, decision_maker=None, config: Dict = None, pr_commit_map: Dict = None, pr_metadata: Dict = None):
+    def __init__(self, mode: str, decision_maker=None, config: Dict = None, pr_commit_map: Dict = None, pr_metadata: Dict = None,
+                 repo: str = None, use_diff_cache: bool = True, version: str = None):
         """
         Args:
             mode: "cherry-pick" or "revert"
@@ -51,47 +52,100 @@ class PRLevelResolver:
             config: Release config dict (for LLM conflict resolver)
             pr_commit_map: Dict mapping PR number to commit SHA
             pr_metadata: Dict mapping PR number to metadata
+            repo: GitHub repo (owner/name) for fetching PR diffs
+            use_diff_cache: Read/write PR diffs from the on-disk diff cache
+            version: Effective release version (defaults to config["version"]);
+                with repo, selects the recorded resolutions that apply
         """
         self.mode = mode
         self.decision_maker = decision_maker
         self.config = config or {}
         self.pr_commit_map = pr_commit_map or {}
         self.pr_metadata = pr_metadata or {}
+        self.repo = repo
+        self.use_diff_cache = use_diff_cache
+        self._merge_commits = None  # SHA -> is merge commit, filled on first use
         self.last_had_conflicts = False
         self.last_conflict_details = None
         self.all_conflicts = []  # Track all conflicts encountered
-        self.resolution_log = Path("/tmp/rdkb-release-conflicts/pr_resolutions.json")
+        self.decisions = {}  # PR number -> PRDecision made this run
+        # Resolutions reorder later runs, so they live in the private per-user
+        # cache directory; the conflicts log is a report artifact
+        self.resolution_log = make_cache_dir(USER_CACHE_DIR) / "pr_resolutions.v1.jsonl"
         self.conflicts_log = Path("/tmp/rdkb-release-conflicts/detailed_conflicts.json")
-        self.resolution_log.parent.mkdir(parents=True, exist_ok=True)
+        self.conflicts_log.parent.mkdir(parents=True, exist_ok=True)
         
-        # Initialize LLM conflict resolver if available and enabled
-        self.conflict_resolver = None
-        if LLMConflictResolver and self.config.get("llm", {}).get("enabled"):
-            try:
-                self.conflict_resolver = LLMConflictResolver(self.config)
-            except Exception as e:
-                print(f"  ⚠️  Could not initialize LLM conflict resolver: {e}")
+        # LLM conflict resolver is created on the first conflict (see the
+        # conflict_resolver property) — clean runs never pay for it
+        self._conflict_resolver = None
+        self._conflict_resolver_loaded = False
         
-        # Load existing resolutions
+        # Load existing resolutions for this repo and release (append-only
+        # log shared by all runs: the latest matching entry per PR wins)
+        version = version if version is not None else self.config.get("version")
+        self.version = str(version) if version is not None else None
         self.resolutions = {}
         if self.resolution_log.exists():
-            with open(self.resolution_log) as f:
-                self.resolutions = json.load(f)
+            for entry in read_jsonl(self.resolution_log):
+                if entry.get("repo") == self.repo and entry.get("version") == self.version:
+                    self.resolutions[str(entry["pr_number"])] = entry
+    
+    @property
+    def conflict_resolver(self):
+        """LLM conflict resolver, initialized on first use (None if unavailable/disabled)."""
+        return self.init_conflict_resolver()
+    
+    def init_conflict_resolver(self):
+        """
+        Create the LLM conflict resolver now instead of on the first conflict.
+        
+        Returns:
+            The resolver (None if unavailable/disabled)
+        """
+        if not self._conflict_resolver_loaded:
+            self._conflict_resolver_loaded = True
+            if self.config.get("llm", {}).get("enabled"):
+                # Imported here so clean runs never load the LLM provider stack
+                try:
+                    from llm_conflict_resolver import LLMConflictResolver
+                    self._conflict_resolver = LLMConflictResolver(self.config)
+                except Exception as e:
+                    print(f"  ⚠️  Could not initialize LLM conflict resolver: {e}")
+        return self._conflict_resolver
+    
+    def dependency_graph(self) -> Dict[int, List[int]]:
+        """
+        PR dependencies recorded by earlier LLM decisions for this repo and
+        release version (entries of other repos/releases are never loaded).
+        
+        Returns:
+            Dict mapping PR number -> PRs it depends on
+        """
+        return {
+            int(pr): res.get("depends_on", [])
+            for pr, res in self.resolutions.items()
+            if res.get("depends_on")
+        }
     
     def handle_conflict(self,
                        pr_number: int,
                        pr_metadata: Dict,
                        conflict_files: List[str],
                        all_prs_metadata: Dict[int, Dict],
-                       detected_conflicts: List[Dict]) -> ResolutionAction:
+                       detected_conflicts: List[Dict],
+                       conflicts_by_pr: Dict[int, List[Dict]] = None) -> ResolutionAction:
         """
         Handle a conflict by making a PR-level decision.
         
+        Args:
+            conflicts_by_pr: Optional precomputed index_conflicts_by_pr() of
+                detected_conflicts (pass it when handling many PRs)
+        
         Returns:
             ResolutionAction indicating what to do with this PR
         """
         print(f"\n  🚨 CONFLICT detected for PR #{pr_number}")
-        print(f"  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+        print(HEAVY_RULE)
         print(f"  Files in conflict: {len(conflict_files)}")
         for f in conflict_files[:5]:
             print(f"    - {f}")
@@ -114,8 +168,10 @@ class PRLevelResolver:
         # Get PR diff for LLM analysis
         pr_diff = self._get_pr_diff(pr_number)
         
-        # Find conflicts specific to this PR
-        pr_conflicts = [c for c in detected_conflicts if c.get("pr_number") == pr_number]
+        # Find conflicts involving this PR
+        if conflicts_by_pr is None:
+            conflicts_by_pr = index_conflicts_by_pr(detected_conflicts)
+        pr_conflicts = conflicts_by_pr.get(pr_number, [])
         
         # Call LLM to make decision
         print(f"  🤖 Consulting LLM for strategic decision...")
@@ -126,6 +182,7 @@ class PRLevelResolver:
             conflicts=pr_conflicts,
             all_prs_metadata=all_prs_metadata
         )
+        self.decision_maker.save_cache()
         
         if not decision:
             print(f"  ❌ LLM decision failed - flagging for manual review")
@@ -136,6 +193,8 @@ class PRLevelResolver:
                 depends_on=[]
             )
         
+        self.decisions[pr_number] = decision
+        
         # Display LLM decision
         print(f"\n  📋 LLM Decision:")
         print(f"    • Decision: {decision.decision}")
@@ -149,15 +208,18 @@ class PRLevelResolver:
         if decision.requires_prs:
             print(f"    • Requires PRs: {decision.requires_prs}")
         
-        # Convert LLM decision to action
-        if decision.decision == "INCLUDE":
+        # Convert LLM decision to action (a decision maker exists, so the
+        # module is already loaded)
+        from llm_pr_decision import EXCLUDE, INCLUDE
+        verdict = decision.decision
+        if verdict == INCLUDE:
             action = ResolutionAction(
                 pr_number=pr_number,
                 action="INCLUDE",
                 reason=decision.rationale,
                 depends_on=decision.requires_prs
             )
-        elif decision.decision == "EXCLUDE":
+        elif verdict == EXCLUDE:
             action = ResolutionAction(
                 pr_number=pr_number,
                 action="EXCLUDE",
@@ -192,23 +254,25 @@ class PRLevelResolver:
             pass
     
     def _get_pr_diff(self, pr_number: int) -> str:
-        """Fetch the full diff for a PR."""
-        # Try to use gh CLI if available
-        result = subprocess.run(
-            ["gh", "pr", "diff", str(pr_number)],
-            capture_output=True, text=True
-        )
-        
-        if result.returncode == 0:
-            return result.stdout
+        """Fetch the full diff for a PR (cached on disk by merge commit SHA)."""
+        try:
+            pr_diff = get_pr_diff(
+                pr_number, repo=self.repo,
+                sha=self.pr_commit_map.get(pr_number),
+                use_cache=self.use_diff_cache
+            )
+        except Exception:
+            pr_diff = None
         
         # Fallback: empty diff
-        return ""
+        return pr_diff or ""
     
     def _save_resolution(self, pr_number: int, action: ResolutionAction, decision):
         """Save the resolution for audit trail."""
-        self.resolutions[str(pr_number)] = {
+        entry = self.resolutions[str(pr_number)] = {
             "pr_number": pr_number,
+            "repo": self.repo,
+            "version": self.version,
             "action": action.action,
             "reason": action.reason,
             "depends_on": action.depends_on,
@@ -218,22 +282,132 @@ class PRLevelResolver:
             "mode": self.mode
         }
         
-        with open(self.resolution_log, "w") as f:
-            json.dump(self.resolutions, f, indent=2)
+        # One appended line per decision: O(1) per PR, and a crash never
+        # loses the decisions already recorded
+        append_jsonl(self.resolution_log, entry)
     
     def _save_conflicts_log(self):
         """Save detailed conflicts log for reporting."""
-        with open(self.conflicts_log, "w") as f:
-            json.dump(self.all_conflicts, f, indent=2)
+        write_json_background(self.conflicts_log, list(self.all_conflicts), indent=False)
+    
+    def flush(self):
+        """Wait until the conflicts log is written to disk."""
+        flush_writes()
+    
+    def _load_merge_commits(self) -> Dict[str, bool]:
+        """
+        Classify every known PR commit as merge / non-merge in one git call.
+        
+        `git rev-list --no-walk --parents` prints "<sha> <parent>..." per
+        commit, so a merge commit is any line with more than one parent.
+        """
+        shas = sorted(set(self.pr_commit_map.values()))
+        if not shas:
+            return {}
+        
+        result = subprocess.run(
+            ["git", "rev-list", "--no-walk", "--parents", *shas],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            return {}
+        
+        merge_commits = {}
+        for line in result.stdout.splitlines():
+            fields = line.split()
+            if fields:
+                merge_commits[fields[0]] = len(fields) > 2
+        return merge_commits
     
     def _is_merge_commit(self, commit_sha: str) -> bool:
         """Check if a commit is a merge commit."""
+        if self._merge_commits is None:
+            self._merge_commits = self._load_merge_commits()
+        
+        if commit_sha in self._merge_commits:
+            return self._merge_commits[commit_sha]
+        
+        # Not a full SHA from pr_commit_map (or batch lookup failed)
         result = subprocess.run(
             ["git", "rev-parse", f"{commit_sha}^2"],
             capture_output=True, text=True
         )
         return result.returncode == 0
     
+    def _git_apply_cmd(self, commit_sha: str, *options: str) -> List[str]:
+        """Build the cherry-pick/revert command for a PR's commit."""
+        cmd = ["git", "cherry-pick" if self.mode == "cherry-pick" else "revert", *options]
+        if self._is_merge_commit(commit_sha):
+            cmd.extend(["-m", "1"])  # Use first parent for merge commits
+        cmd.append(commit_sha)
+        return cmd
+    
+    def forecast_conflicts(self, pr_numbers: List[int], base: str = "HEAD",
+                           max_workers: int = 4) -> Dict[int, List[str]]:
+        """
+        Predict which PRs will conflict, checking them in parallel.
+        
+        Each PR is applied on its own (`--no-commit`) to `base` in one of
+        max_workers throwaway worktrees, so the real worktree is never
+        touched. PRs are checked independently of each other: a forecast
+        conflict may disappear (or a new one appear) once earlier PRs of
+        the release have been applied, so this is a forecast only.
+        
+        Args:
+            pr_numbers: PRs to check (those without a known commit are skipped)
+            base: Commit the PRs are applied to
+            max_workers: Number of parallel worktrees
+            
+        Returns:
+            Dict mapping PR number -> files expected to conflict (PRs
+            expected to apply cleanly are omitted)
+        """
+        targets = [(pr, self.pr_commit_map[pr]) for pr in pr_numbers if pr in self.pr_commit_map]
+        if not targets:
+            return {}
+        
+        # Classify merge commits up front (not thread-safe to do lazily)
+        if self._merge_commits is None:
+            self._merge_commits = self._load_merge_commits()
+        commands = {pr: self._git_apply_cmd(sha, "--no-commit") for pr, sha in targets}
+        
+        tmp_root = Path(tempfile.mkdtemp(prefix="rdkb-forecast-"))
+        worktrees = queue.Queue()
+        created = []
+        try:
+            for i in range(min(max_workers, len(targets))):
+                path = tmp_root / f"wt{i}"
+                result = subprocess.run(
+                    ["git", "worktree", "add", "--detach", "-q", str(path), base],
+                    capture_output=True, text=True
+                )
+                if result.returncode == 0:
+                    created.append(path)
+                    worktrees.put(path)
+            if not created:
+                return {}
+            
+            def check(pr_number):
+                path = worktrees.get()
+                try:
+                    result = subprocess.run(commands[pr_number], capture_output=True,
+                                            text=True, cwd=path)
+                    return pr_number, [] if result.returncode == 0 else unmerged_files(cwd=path)
+                finally:
+                    subprocess.run(["git", "reset", "--hard", "-q", base],
+                                   capture_output=True, cwd=path)
+                    worktrees.put(path)
+            
+            with ThreadPoolExecutor(max_workers=len(created)) as executor:
+                results = executor.map(check, [pr for pr, _ in targets])
+                return {pr: files for pr, files in results if files}
+        finally:
+            for path in created:
+                subprocess.run(["git", "worktree", "remove", "--force", str(path)],
+                               capture_output=True)
+            shutil.rmtree(tmp_root, ignore_errors=True)
+            subprocess.run(["git", "worktree", "prune"], capture_output=True)
+    
     def execute_pr(self, pr_number: int, action) -> bool:
         """Execute cherry-pick or revert for a PR.
         
@@ -268,8 +442,8 @@ class PRLevelResolver:
         # Apply the action
         result = self.apply_action(action, commit_sha, pr_number, pr_meta)
         
-        # Save conflicts log if any conflicts were encountered
-        if self.all_conflicts:
+        # Save conflicts log when this PR added a conflict
+        if self.last_had_conflicts:
             self._save_conflicts_log()
         
         return result
@@ -298,22 +472,8 @@ class PRLevelResolver:
             
             print(f"  ✅ Attempting to {self.mode} PR (full PR accepted)")
             
-            # Check if this is a merge commit
-            is_merge = self._is_merge_commit(commit_sha)
-            
             # Try the operation
-            if self.mode == "cherry-pick":
-                cmd = ["git", "cherry-pick"]
-                if is_merge:
-                    cmd.extend(["-m", "1"])  # Use first parent for merge commits
-                cmd.append(commit_sha)
-                result = subprocess.run(cmd, capture_output=True, text=True)
-            else:
-                cmd = ["git", "revert"]
-                if is_merge:
-                    cmd.extend(["-m", "1"])
-                cmd.append(commit_sha)
-                result = subprocess.run(cmd, capture_output=True, text=True)
+            result = subprocess.run(self._git_apply_cmd(commit_sha), capture_output=True, text=True)
             
             if result.returncode == 0:
                 print(f"  ✅ Successfully applied PR")
@@ -357,7 +517,8 @@ class PRLevelResolver:
                     resolved = self.conflict_resolver.resolve_all_conflicts(
                         pr_number or action.pr_number,
                         pr_metadata,
-                        operation=self.mode
+                        operation=self.mode,
+                        conflicted_files=conflict_files
                     )
                     
                     if resolved:
@@ -396,7 +557,7 @@ class PRLevelResolver:
         else:  # MANUAL
             print(f"  🔴 MANUAL REVIEW REQUIRED")
             print(f"  Reason: {action.reason}")
-            print(f"  ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+            print(HEAVY_RULE)
             print(f"  Please resolve manually:")
             print(f"    1. Review the conflict")
             print(f"    2. Decide to include or exclude this PR")
@@ -412,15 +573,7 @@ def check_for_conflicts() -> List[str]:
     Returns:
         List of files with conflicts (empty if no conflicts)
     """
-    result = subprocess.run(
-        ["git", "diff", "--name-only", "--diff-filter=U"],
-        capture_output=True, text=True
-    )
-    
-    if result.returncode != 0:
-        return []
-    
-    return [f.strip() for f in result.stdout.strip().splitlines() if f.strip()]
+    return unmerged_files()
 
 
 def get_detailed_conflict_info(conflict_files: List[str]) -> List[Dict]:
@@ -508,11 +661,13 @@ def get_detailed_conflict_info(conflict_files: List[str]) -> List[Dict]:
 # ── CLI for testing ───────────────────────────────────────────────────────────
 if __name__ == "__main__":
     import argparse
-    import yaml
+    from release_config import load_config
     
     parser = argparse.ArgumentParser()
     parser.add_argument("--mode", choices=["cherry-pick", "revert"], required=True)
     parser.add_argument("--pr", type=int, required=True)
+    parser.add_argument("--repo", required=True, help="GitHub repo (owner/name)")
+    parser.add_argument("--version", help="Override version from config")
     parser.add_argument("--config", default=".release-config.yml")
     parser.add_argument("--conflicts-file", help="JSON file with conflict analysis")
     args = parser.parse_args()
@@ -529,25 +684,23 @@ if __name__ == "__main__":
     # Load config
     config = {}
     if Path(args.config).exists():
-        with open(args.config) as f:
-            config = yaml.safe_load(f)
+        config = load_config(args.config)
     
     # Load conflict analysis
     detected_conflicts = []
     if args.conflicts_file and Path(args.conflicts_file).exists():
-        with open(args.conflicts_file) as f:
-            conflict_data = json.load(f)
-            detected_conflicts = conflict_data.get("conflicts", {}).get("all", [])
+        conflict_data = read_json(args.conflicts_file)
+        detected_conflicts = conflict_data.get("conflicts", {}).get("all", [])
     
     # Create decision maker if LLM is enabled
     decision_maker = None
     if config.get("llm", {}).get("enabled"):
-        sys.path.insert(0, str(Path(__file__).parent))
         from llm_pr_decision import LLMPRDecisionMaker
         decision_maker = LLMPRDecisionMaker(config)
     
     # Create resolver
-    resolver = PRLevelResolver(args.mode, decision_maker)
+    resolver = PRLevelResolver(args.mode, decision_maker, config=config, repo=args.repo,
+                               version=args.version)
     
     # Dummy PR metadata
     pr_metadata = {
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+release_config.py
+=================
+Release configuration schema and validation for the RDK-B release agent.
+
+The structure of .release-config.yml is described once, declaratively, in
+RELEASE_CONFIG_SCHEMA (a JSON-Schema subset). The schema is compiled into
+a tree of plain check functions when this module is imported, so every
+entrypoint validates the same rules without re-interpreting the schema.
+
+load_config() parses the YAML file with PyYAML's safe loader (the libyaml
+C loader when available).
+
+Supported schema keywords:
+  type, enum, const, required, properties, items, minimum, minItems, minLength,
+  allOf, if/then — plus "x-message" to replace a subschema's errors with
+  a single human-readable message.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+
+RELEASE_CONFIG_SCHEMA = {
+    "type": "object",
+    "required": ["version", "strategy"],
+    "properties": {
+        "component_name": {"type": "string"},
+        "version": {"type": ["string", "number"], "minLength": 1},
+        "strategy": {"enum": ["exclude", "include"]},
+        "prs": {"type": "array", "items": {"type": ["integer", "string"]}},
+        "dry_run": {"type": "boolean"},
+        "base_branch": {"type": "string", "minLength": 1},
+        "target_branch": {"type": "string", "minLength": 1},
+        "release_branch": {"type": "string", "minLength": 1},
+        "notify": {"type": "array", "items": {"type": "string"}},
+        "llm": {
+            "type": "object",
+            "properties": {
+                "enabled": {"type": "boolean"},
+                "provider": {"type": "string"},
+                "model": {"type": "string"},
+                "api_key_env": {"type": "string"},
+                "endpoint": {"type": "string"},
+                "temperature": {"type": "number"},
+                "timeout_seconds": {"type": "number"},
+                "max_calls_per_run": {"type": "number"},
+                "async": {"type": "boolean"},
+                "max_concurrency": {"type": "number", "minimum": 1},
+                "rps": {"type": "number", "minimum": 0},  # 0 = no rate limit
+                "prefilter": {"type": "boolean"}
+            }
+        }
+    },
+    "allOf": [
+        {
+            "if": {"required": ["strategy"], "properties": {"strategy": {"const": "include"}}},
+            "then": {
+                "required": ["prs"],
+                "properties": {"prs": {"minItems": 1}},
+                "x-message": "'prs' list is REQUIRED when strategy is 'include'"
+            }
+        }
+    ]
+}
+
+
+# ── Schema Compiler ───────────────────────────────────────────────────────────
+
+_TYPE_CHECKS = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+}
+
+Validator = Callable[[Any, str], List[str]]
+
+
+def _label(path: str) -> str:
+    return f"'{path}'" if path else "config"
+
+
+def compile_schema(schema: Dict) -> Validator:
+    """
+    Compile a schema into a validator function.
+
+    Returns:
+        validate(value, path) -> list of error messages (empty if valid)
+    """
+    checks: List[Validator] = []
+
+    if "type" in schema:
+        types = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        type_fns = [_TYPE_CHECKS[t] for t in types]
+        expected = " or ".join(types)
+
+        def check_type(value, path):
+            if any(fn(value) for fn in type_fns):
+                return []
+            return [f"{_label(path)} must be {expected} (got: {type(value).__name__})"]
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+        allowed_text = " or ".join(f"'{a}'" for a in allowed)
+
+        def check_enum(value, path):
+            if value in allowed:
+                return []
+            return [f"{_label(path)} must be {allowed_text} (got: '{value}')"]
+        checks.append(check_enum)
+
+    if "const" in schema:
+        const = schema["const"]
+        checks.append(lambda value, path: [] if value == const else [f"{_label(path)} must be '{const}'"])
+
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+
+        def check_min_length(value, path):
+            if isinstance(value, str) and len(value) < min_length:
+                return [f"{_label(path)} must not be empty"]
+            return []
+        checks.append(check_min_length)
+
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+
+        def check_minimum(value, path):
+            if _TYPE_CHECKS["number"](value) and value < minimum:
+                return [f"{_label(path)} must be at least {minimum} (got: {value})"]
+            return []
+        checks.append(check_minimum)
+
+    if "minItems" in schema:
+        min_items = schema["minItems"]
+
+        def check_min_items(value, path):
+            if isinstance(value, list) and len(value) < min_items:
+                return [f"{_label(path)} must have at least {min_items} item(s)"]
+            return []
+        checks.append(check_min_items)
+
+    if "required" in schema:
+        required = schema["required"]
+
+        def check_required(value, path):
+            if not isinstance(value, dict):
+                return []
+            prefix = f"{path}." if path else ""
+            return [f"'{prefix}{key}' is required" for key in required if key not in value]
+        checks.append(check_required)
+
+    if "properties" in schema:
+        properties = {key: compile_schema(sub) for key, sub in schema["properties"].items()}
+
+        def check_properties(value, path):
+            if not isinstance(value, dict):
+                return []
+            prefix = f"{path}." if path else ""
+            errors = []
+            for key, validate in properties.items():
+                if key in value:
+                    errors.extend(validate(value[key], f"{prefix}{key}"))
+            return errors
+        checks.append(check_properties)
+
+    if "items" in schema:
+        validate_item = compile_schema(schema["items"])
+
+        def check_items(value, path):
+            if not isinstance(value, list):
+                return []
+            errors = []
+            for i, item in enumerate(value):
+                errors.extend(validate_item(item, f"{path}[{i}]"))
+            return errors
+        checks.append(check_items)
+
+    for sub in schema.get("allOf", []):
+        checks.append(compile_schema(sub))
+
+    if "if" in schema:
+        validate_if = compile_schema(schema["if"])
+        validate_then = compile_schema(schema.get("then", {}))
+        checks.append(lambda value, path: [] if validate_if(value, path) else validate_then(value, path))
+
+    message = schema.get("x-message")
+
+    def validate(value, path=""):
+        errors = []
+        for check in checks:
+            errors.extend(check(value, path))
+        if errors and message:
+            return [message]
+        return errors
+
+    return validate
+
+
+# Compiled once at import
+_validate_release_config = compile_schema(RELEASE_CONFIG_SCHEMA)
+
+
+def validate_release_config(config: Dict) -> List[str]:
+    """
+    Validate a release config against RELEASE_CONFIG_SCHEMA.
+
+    Keys whose value is None are treated as missing.
+
+    Returns:
+        List of human-readable errors (empty if the config is valid)
+    """
+    config = {k: v for k, v in config.items() if v is not None}
+    return _validate_release_config(config)
+
+
+# ── Config Loading ────────────────────────────────────────────────────────────
+
+def load_config(path) -> Dict:
+    """
+    Load a release config YAML file.
+    
+    Returns:
+        Parsed config (empty dict for an empty file)
+    
+    Raises:
+        ImportError: If PyYAML is not installed
+    """
+    import yaml
+    # libyaml's C loader when PyYAML was built with it (same safe semantics)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(Path(path).read_bytes(), Loader=loader) or {}
@@ -31,35 +31,28 @@ Usage:
 """
 
 import argparse
-import json
+import logging
 import subprocess
 import sys
 import time
 from pathlib import Path
 from datetime import datetime
 
-try:
-    import yaml
-except ImportError:
-    print("ERROR: PyYAML not installed. Run: pip install pyyaml")
-    sys.exit(1)
-
-# Add scripts directory to path
-SCRIPTS_DIR = Path(__file__).parent
-sys.path.insert(0, str(SCRIPTS_DIR))
-
-from pr_level_resolver import PRLevelResolver, check_for_conflicts, ResolutionAction
+# Sibling modules resolve from the script's own directory (sys.path[0])
 from pr_discovery import (
     discover_prs_since_tag,
-    validate_pr_dependencies,
-    print_discovery_summary,
-    print_dependency_warnings
+    order_prs_by_dependencies,
+    print_discovery_summary
 )
-from logger import init_logger
-from report_generator import ReportGenerator, ReleaseReport
-from utils import BOLD, DIM, c, ok, warn, err, info, dim, banner, section as _section
+from diff_cache import get_prs_metadata, prune_diff_cache
+from github_api import fetch_pr_shas, get_client
+from logger import LOG_SEPARATOR, init_logger
+from release_config import load_config, validate_release_config
+from utils import BANNER_RULE, BOLD, DIM, c, ok, warn, err, info, dim, banner, section as _section
 
 START_TIME = time.time()
+SUMMARY_RULE = c(BOLD, "═" * 70)
+PR_BODY_NOTIFY_FOOTER = "\n\n---\ncc: {mentions}"
 
 
 def section(step, title):
@@ -97,6 +90,12 @@ parser.add_argument("--repo", help="GitHub repo (owner/name) - auto-detected fro
 parser.add_argument("--config", default=".release-config.yml")
 parser.add_argument("--version", help="Override version from config")
 parser.add_argument("--dry-run", action="store_true")
+parser.add_argument("--no-cache", action="store_true",
+                    help="Re-fetch PR diffs and metadata instead of using the on-disk cache")
+parser.add_argument("--refresh-discovery", action="store_true",
+                    help="Re-scan git history for PRs instead of using the cached discovery")
+parser.add_argument("--forecast-conflicts", action="store_true",
+                    help="Test-apply each PR in throwaway worktrees first and log expected conflicts")
 args = parser.parse_args()
 
 # ── Auto-detect Repository ────────────────────────────────────────────────────
@@ -116,8 +115,11 @@ if not config_path.exists():
     print(err(f"Config file not found: {config_path}"))
     sys.exit(1)
 
-with open(config_path) as f:
-    cfg = yaml.safe_load(f)
+try:
+    cfg = load_config(config_path)
+except ImportError:
+    print("ERROR: PyYAML not installed. Run: pip install pyyaml")
+    sys.exit(1)
 
 def parse_pr_list(prs):
     """Parse PR list supporting both formats:
@@ -143,6 +145,7 @@ def parse_pr_list(prs):
 VERSION = args.version or cfg.get("version")
 STRATEGY = cfg.get("strategy", "").lower()
 CONFIGURED_PRS = parse_pr_list(cfg.get("prs"))
+CONFIGURED_PRS_SET = frozenset(CONFIGURED_PRS)  # Membership tests
 DRY_RUN = args.dry_run or cfg.get("dry_run", False)
 RELEASE_BRANCH = cfg.get("release_branch", f"release/{VERSION}")
 COMPONENT_NAME = cfg.get("component_name") or REPO.split("/")[-1]
@@ -156,14 +159,13 @@ DEFAULT_TARGET_BRANCH = "main"
 BASE_BRANCH = cfg.get("base_branch", DEFAULT_BASE_BRANCH)
 TARGET_BRANCH = cfg.get("target_branch", DEFAULT_TARGET_BRANCH)
 
-# Validate config
-errors = []
-if not VERSION:
-    errors.append("'version' is required")
-if STRATEGY not in ("exclude", "include"):
-    errors.append(f"'strategy' must be 'exclude' or 'include' (got: '{STRATEGY}')")
-if STRATEGY == "include" and not CONFIGURED_PRS:
-    errors.append("'prs' list is REQUIRED when strategy is 'include'")
+# Validate the effective config (CLI overrides and normalized values applied)
+errors = validate_release_config({
+    **cfg,
+    "version": VERSION or None,
+    "strategy": STRATEGY,
+    "prs": CONFIGURED_PRS
+})
 if errors:
     print(err("Configuration errors:"))
     for e in errors:
@@ -180,24 +182,32 @@ print(f"  {'Base Branch':<16}: {BASE_BRANCH}")
 print(f"  {'Merge To':<16}: {TARGET_BRANCH} (draft PR target)")
 print(f"  {'Release Branch':<16}: {RELEASE_BRANCH}")
 print(f"  {'Dry Run':<16}: {DRY_RUN}")
-print(c(BOLD, "═" * 64))
+print(BANNER_RULE)
 
 # ── Initialize Logging ────────────────────────────────────────────────────────
 logger = init_logger(COMPONENT_NAME, VERSION)
-logger.info("=" * 60)
+logger.info(LOG_SEPARATOR)
 logger.info(f"Release Orchestrator Started")
 logger.info(f"Component: {COMPONENT_NAME}, Version: {VERSION}")
 logger.info(f"Strategy: {STRATEGY}, Dry Run: {DRY_RUN}")
-logger.info("=" * 60)
+logger.info(LOG_SEPARATOR)
 print(f"\n  📋 Log file: {logger.get_log_file()}")
 
+# Drop cached PR diffs older than 30 days
+pruned = prune_diff_cache()
+if pruned:
+    logger.info(f"Pruned {pruned} stale cached PR diffs")
+
 
 # ── Smart PR Discovery ────────────────────────────────────────────────────────
 section(1, "Smart PR Discovery from Git History")
 
 # Auto-discover PRs from git history
 logger.info("Starting PR auto-discovery from git history")
-discovery_result = discover_prs_since_tag(base_branch=BASE_BRANCH, repo_path=".")
+discovery_result = discover_prs_since_tag(
+    base_branch=BASE_BRANCH, repo_path=".",
+    use_cache=not (args.refresh_discovery or args.no_cache)
+)
 if discovery_result:
     print_discovery_summary(discovery_result, CONFIGURED_PRS, STRATEGY)
     logger.info(f"Discovered {len(discovery_result.all_prs)} PRs since tag {discovery_result.last_tag}")
@@ -209,15 +219,21 @@ if discovery_result:
 else:
     print(f"  {warn('Could not auto-discover PRs - proceeding with configured list')}")
     logger.warning("Could not auto-discover PRs from git history")
-    all_discovered_prs = []
     last_tag = None
     last_tag_ref = None
-    # Create empty discovery result structure for configured PRs
+    # Resolve merge commits for the configured PRs in one batched API call
+    print(f"  🔍 Fetching merge commits for {len(CONFIGURED_PRS)} configured PRs...")
+    pr_shas = fetch_pr_shas(REPO, CONFIGURED_PRS)
+    all_discovered_prs = list(pr_shas)  # Ordered oldest merge first
+    logger.info(f"Resolved merge commits for {len(pr_shas)}/{len(CONFIGURED_PRS)} configured PRs")
+    print(f"  ✅ Resolved merge commits for {len(pr_shas)} PRs")
+    # Create minimal discovery result structure for configured PRs
     from dataclasses import dataclass
     @dataclass
     class MinimalDiscoveryResult:
         pr_commit_map: dict
-    discovery_result = MinimalDiscoveryResult(pr_commit_map={})
+        last_tag: str = None
+    discovery_result = MinimalDiscoveryResult(pr_commit_map=pr_shas)
 
 # ── Resolve Operation Plan ────────────────────────────────────────────────────
 section(2, "Resolving Operation Plan")
@@ -231,11 +247,16 @@ print(f"  └─ Configured PRs: {CONFIGURED_PRS}")
 print(f"\n  🔄 PLANNING:")
 print(f"  ├─ Total PRs in window: {len(all_discovered_prs)}")
 
+# Split configured PRs into found / not found in one pass (set lookups)
+discovered_set = set(all_discovered_prs)
+configured_found, not_found = [], []
+for pr in CONFIGURED_PRS:
+    (configured_found if pr in discovered_set else not_found).append(pr)
+
 if STRATEGY == "exclude":
     # EXCLUDE: Revert only the PRs in the exclude list from base_branch
-    excluded_prs = [pr for pr in CONFIGURED_PRS if pr in all_discovered_prs]
-    not_found = [pr for pr in CONFIGURED_PRS if pr not in all_discovered_prs]
-    intake_prs = [pr for pr in all_discovered_prs if pr not in excluded_prs]
+    excluded_prs = configured_found
+    intake_prs = [pr for pr in all_discovered_prs if pr not in CONFIGURED_PRS_SET]
     operation_prs = list(reversed(excluded_prs))  # Revert newest first
     operation_type = "revert"
     
@@ -247,8 +268,7 @@ if STRATEGY == "exclude":
         print(f"  └─ All configured PRs found")
 elif STRATEGY == "include":
     # INCLUDE: Cherry-pick only the configured PRs from base_branch
-    included_prs = [pr for pr in CONFIGURED_PRS if pr in all_discovered_prs]
-    not_found = [pr for pr in CONFIGURED_PRS if pr not in all_discovered_prs]
+    included_prs = configured_found
     intake_prs = included_prs
     operation_prs = included_prs  # Cherry-pick oldest first
     operation_type = "cherry-pick"
@@ -266,19 +286,10 @@ print(f"  └─ PRs in final release: {len(intake_prs)}")
 
 # Fetch PR metadata for reporting
 print(f"\n  🔍 Fetching PR metadata...")
-pr_metadata = {}
-for pr_num in all_discovered_prs[:100]:  # Limit to avoid rate limits
-    try:
-        result = subprocess.run(
-            ["gh", "pr", "view", str(pr_num), "--repo", REPO, "--json", 
-             "number,title,author,mergedAt,url"],
-            capture_output=True, text=True, timeout=10
-        )
-        if result.returncode == 0:
-            pr_data = json.loads(result.stdout)
-            pr_metadata[pr_num] = pr_data
-    except Exception as e:
-        logger.warning(f"Failed to fetch metadata for PR #{pr_num}: {e}")
+# Merged PRs come from the on-disk cache; the rest in batched GraphQL requests
+pr_metadata = get_prs_metadata(REPO, all_discovered_prs, use_cache=not args.no_cache)
+if len(pr_metadata) < len(all_discovered_prs):
+    logger.warning(f"Failed to fetch metadata for {len(all_discovered_prs) - len(pr_metadata)} PR(s)")
 
 print(f"  ✅ Fetched metadata for {len(pr_metadata)} PRs")
 
@@ -332,38 +343,90 @@ print(f"  └─ LLM Conflict Resolution: {'ENABLED' if cfg.get('llm', {}).get('
 print(f"\n  🔄 PROCESSING:")
 logger.info(f"Executing {operation_type} on {len(operation_prs)} PRs")
 
-# Initialize resolver
+# Initialize resolver (imported here so --help and config errors stay fast)
+from pr_level_resolver import PRLevelResolver
+
 resolver = PRLevelResolver(
     mode=operation_type,
     decision_maker=None,
     config=cfg,
     pr_commit_map=discovery_result.pr_commit_map if discovery_result else {},
-    pr_metadata=pr_metadata
+    pr_metadata=pr_metadata,
+    repo=REPO,
+    use_diff_cache=not args.no_cache,
+    version=VERSION
 )
 
 # Track results
 successful_prs = []
 failed_prs = []
 skipped_prs = []
+manual_review_prs = []
 conflicts_resolved = 0
 
-# Execute each operation
+# Every PR needs a merge commit SHA: backfill missing ones in one batched
+# request, and fail the rest up front instead of inside the execution loop
+pr_commit_map = resolver.pr_commit_map
+missing_shas = [pr for pr in operation_prs if pr not in pr_commit_map]
+if missing_shas:
+    pr_commit_map.update(fetch_pr_shas(REPO, missing_shas))
+    unresolved = [pr for pr in missing_shas if pr not in pr_commit_map]
+    if unresolved:
+        print(f"  {warn(f'├─ No merge commit found (failed): {unresolved}')}")
+        logger.error(f"No merge commit SHA for PRs {unresolved}")
+        failed_prs.extend(unresolved)
+        operation_prs = [pr for pr in operation_prs if pr not in unresolved]
+
+# Order PRs by dependencies recorded in earlier LLM decisions for this repo
+# and version: prerequisites are cherry-picked first; for reverts, dependents
+# are reverted first. This only reorders — every configured PR is still
+# processed, and a dependency cycle keeps the original order.
+pr_dependencies = resolver.dependency_graph()
+if pr_dependencies:
+    if operation_type == "cherry-pick":
+        ordered_prs, dependency_cycles = order_prs_by_dependencies(operation_prs, pr_dependencies)
+    else:
+        ordered_prs, dependency_cycles = order_prs_by_dependencies(
+            list(reversed(operation_prs)), pr_dependencies
+        )
+        ordered_prs.reverse()
+    
+    if ordered_prs != operation_prs:
+        print(f"  ├─ Dependency order: {ordered_prs}")
+        logger.info(f"PRs reordered by dependencies: {ordered_prs}")
+    for cycle in dependency_cycles:
+        print(f"  {warn(f'├─ Dependency cycle (keeping original order): {cycle}')}")
+        logger.warning(f"Dependency cycle between PRs {cycle} - keeping original order")
+    operation_prs = ordered_prs
+
+# Forecast conflicts (opt-in: each PR is test-applied in parallel throwaway
+# worktrees, which costs a worktree checkout per worker)
+if args.forecast_conflicts:
+    conflict_forecast = resolver.forecast_conflicts(operation_prs)
+    if conflict_forecast:
+        print(f"  ├─ Conflicts expected: {sorted(conflict_forecast)}")
+        for pr_num, files in conflict_forecast.items():
+            logger.info(f"PR #{pr_num}: conflict expected in {len(files)} file(s): {files}")
+        # Set up the LLM conflict resolver now rather than mid-run
+        resolver.init_conflict_resolver()
+
+# Execute each operation (loop invariants hoisted out of the per-PR body)
+action = "INCLUDE" if operation_type == "cherry-pick" else "EXCLUDE"
+operation_label = operation_type.upper()
+total_ops = len(operation_prs)
+execute_pr = resolver.execute_pr
+
 for i, pr_num in enumerate(operation_prs, 1):
     pr_meta = pr_metadata.get(pr_num, {})
     pr_title = pr_meta.get("title", f"PR #{pr_num}")[:50]
     
-    print(f"\n  [{i}/{len(operation_prs)}] PR #{pr_num}: {pr_title}")
-    
-    if operation_type == "cherry-pick":
-        action = "INCLUDE"
-    else:
-        action = "EXCLUDE"
+    print(f"\n  [{i}/{total_ops}] PR #{pr_num}: {pr_title}")
     
-    success = resolver.execute_pr(pr_num, action)
+    success = execute_pr(pr_num, action)
     
     if success:
         successful_prs.append(pr_num)
-        print(f"  ✅ {operation_type.upper()} completed successfully")
+        print(f"  ✅ {operation_label} completed successfully")
         
         # Check if conflicts were resolved
         if resolver.last_had_conflicts:
@@ -371,9 +434,12 @@ for i, pr_num in enumerate(operation_prs, 1):
             logger.info(f"PR #{pr_num}: Conflict resolved by LLM")
     else:
         failed_prs.append(pr_num)
-        print(f"  ❌ {operation_type.upper()} failed - requires manual resolution")
+        print(f"  ❌ {operation_label} failed - requires manual resolution")
         logger.error(f"PR #{pr_num}: Operation failed")
 
+# The conflicts log is written in the background; the report reads it
+resolver.flush()
+
 # ── Execution Summary ──────────────────────────────────────────────────────────
 elapsed = time.time() - START_TIME
 
@@ -401,11 +467,13 @@ logger.info(f"Execution complete: {len(successful_prs)} successful, {len(failed_
 section(5, "Generate Report & Create Draft PR")
 
 
-print(f"\n  📥 INPUTS:")
-print(f"  ├─ Successful PRs: {len(successful_prs)}")
-print(f"  ├─ Failed PRs: {len(failed_prs)}")
-print(f"  ├─ Skipped PRs: {len(skipped_prs)}")
-print(f"  └─ Conflicts Auto-Resolved: {conflicts_resolved}")
+print("\n".join([
+    f"\n  📥 INPUTS:",
+    f"  ├─ Successful PRs: {len(successful_prs)}",
+    f"  ├─ Failed PRs: {len(failed_prs)}",
+    f"  ├─ Skipped PRs: {len(skipped_prs)}",
+    f"  └─ Conflicts Auto-Resolved: {conflicts_resolved}",
+]))
 
 if DRY_RUN:
     print(f"\n  {info('🔍 DRY RUN MODE - Simulation complete (no draft PR created)')}")
@@ -417,133 +485,170 @@ print(f"\n  🔄 PROCESSING:")
 print(f"  📄 Step 1: Generating comprehensive release report...")
 logger.info("Generating comprehensive release report")
 
-# Build report data with simplified structure
-report_data = ReleaseReport(
-    component_name=COMPONENT_NAME,
-    version=VERSION,
-    strategy=STRATEGY,
-    base_branch=BASE_BRANCH,
-    release_branch=RELEASE_BRANCH,
-    last_tag=discovery_result.last_tag if discovery_result else None,
-    total_prs_discovered=len(all_discovered_prs) if all_discovered_prs else 0,
-    prs_configured=CONFIGURED_PRS,
-    conflicts_detected=0,  # No pre-detection in new workflow
-    conflicts_critical=0,
-    conflicts_medium=0,
-    conflicts_low=0,
-    llm_decisions={},  # No PR-level LLM decisions in new workflow
-    prs_to_include=operation_prs if STRATEGY == "include" else [pr for pr in all_discovered_prs if pr not in CONFIGURED_PRS],
-    prs_to_exclude=[] if STRATEGY == "include" else CONFIGURED_PRS,
-    prs_manual_review=[],
-    dependency_warnings=[],
-    dependency_recommendations=[],
-    missing_dependencies={},
-    successful_prs=successful_prs,
-    failed_prs=failed_prs,
-    skipped_prs=skipped_prs,
-    execution_time=elapsed,
-    dry_run=False,
-    timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-)
+# Imported here: dry runs exit above without ever building a report
+from report_generator import ReleaseReport, get_report_generator
+from llm_pr_decision import DecisionView
+
+
+def build_release_report(decisions, prs_to_include, prs_to_exclude, elapsed):
+    """Assemble the ReleaseReport and write it; returns (report path, markdown)."""
+    report_data = ReleaseReport(
+        component_name=COMPONENT_NAME,
+        version=VERSION,
+        strategy=STRATEGY,
+        base_branch=BASE_BRANCH,
+        release_branch=RELEASE_BRANCH,
+        last_tag=discovery_result.last_tag if discovery_result else None,
+        total_prs_discovered=len(all_discovered_prs) if all_discovered_prs else 0,
+        prs_configured=CONFIGURED_PRS,
+        conflicts_detected=0,  # No pre-detection in new workflow
+        conflicts_critical=0,
+        conflicts_medium=0,
+        conflicts_low=0,
+        llm_decisions=DecisionView(decisions),  # Usually empty: LLM only resolves conflicts
+        prs_to_include=prs_to_include,
+        prs_to_exclude=prs_to_exclude,
+        prs_manual_review=manual_review_prs,
+        dependency_warnings=[],
+        dependency_recommendations=[],
+        missing_dependencies={},
+        successful_prs=successful_prs,
+        failed_prs=failed_prs,
+        skipped_prs=skipped_prs,
+        execution_time=elapsed,
+        dry_run=False,
+        timestamp=datetime.now().isoformat(sep=" ", timespec="seconds")
+    )
+    generator = get_report_generator()
+    text = generator.render_report(report_data)
+    return generator.generate_report(report_data, text), text
+
+
+def build_report_and_body():
+    """Write the report and build the draft PR body from it; returns (report_file, body)."""
+    if STRATEGY == "include":
+        report_file, report_text = build_release_report(resolver.decisions, operation_prs, [], elapsed)
+    else:
+        report_file, report_text = build_release_report(resolver.decisions, intake_prs, CONFIGURED_PRS, elapsed)
+    return report_file, build_pr_body(report_text)
 
-# Generate report
-report_gen = ReportGenerator()
-report_file = report_gen.generate_report(report_data)
+
+def build_pr_body(report_text):
+    """Draft PR body: the report plus optional notifications."""
+    notify = cfg.get("notify", [])
+    if not notify:
+        return report_text
+    return report_text + PR_BODY_NOTIFY_FOOTER.format(mentions=" ".join(f"@{n}" for n in notify))
+
+
+report_file, pr_body = build_report_and_body()
 print(f"  ✅ Report generated: {report_file}")
-logger.info(f"Report generated: {report_file}")
+logger.info("Report generated: %s", report_file)
 
-# ──  Push Branch ──────────────────────────────────────────────────────────────
-print(f"\n  📤 Step 2: Pushing {RELEASE_BRANCH} to remote...")
+# ──  Push Branch & Create Draft PR ─────────────────────────────────────────────
+def run_git(*cmd):
+    """Run a git command; returns (returncode, stdout, stderr)."""
+    result = subprocess.run(["git", *cmd], capture_output=True, text=True)
+    return result.returncode, result.stdout, result.stderr
 
-# Check if remote branch exists
-remote_check = subprocess.run(
-    ["git", "ls-remote", "--heads", "origin", RELEASE_BRANCH],
-    capture_output=True, text=True
-)
-remote_exists = remote_check.returncode == 0 and remote_check.stdout.strip()
 
-if remote_exists:
-    print(f"  ⚠️  Remote branch exists - updating with --force-with-lease...")
-    push_result = subprocess.run(
-        ["git", "push", "--force-with-lease", "origin", RELEASE_BRANCH],
-        capture_output=True, text=True
-    )
-else:
+def push_release_branch():
+    """Push RELEASE_BRANCH to origin (--force-with-lease if it already exists there)."""
+    returncode, stdout, _ = run_git("ls-remote", "--heads", "origin", RELEASE_BRANCH)
+    if returncode == 0 and stdout.strip():
+        print(f"  ⚠️  Remote branch exists - updating with --force-with-lease...")
+        return run_git("push", "--force-with-lease", "origin", RELEASE_BRANCH)
     print(f"  📤 Creating new remote branch...")
-    push_result = subprocess.run(
-        ["git", "push", "-u", "origin", RELEASE_BRANCH],
-        capture_output=True, text=True
-    )
+    return run_git("push", "-u", "origin", RELEASE_BRANCH)
 
-if push_result.returncode != 0:
-    print(f"  ❌ Failed to push branch")
-    print(f"  Error: {push_result.stderr}")
-    logger.error(f"Failed to push branch: {push_result.stderr}")
-    sys.exit(1)
 
-print(f"  ✅ Branch pushed successfully")
-logger.info(f"Branch pushed: {RELEASE_BRANCH}")
+print(f"\n  📤 Step 2: Pushing {RELEASE_BRANCH} to remote...")
+push_returncode, _, push_stderr = push_release_branch()
 
-# ── Create Draft PR ───────────────────────────────────────────────────────────
-print(f"\n  📝 Step 3: Creating draft pull request...")
-print(f"  ├─ Base: {TARGET_BRANCH}")
-print(f"  ├─ Head: {RELEASE_BRANCH}")
-print(f"  └─ Using comprehensive report as PR body")
+if push_returncode != 0:
+    print(f"  ❌ Failed to push branch\n  Error: {push_stderr}")
+    logger.error("Failed to push branch: %s", push_stderr)
+    sys.exit(1)
 
-# Read the report content
-pr_body = Path(report_file).read_text()
+print(f"  ✅ Branch pushed successfully")
+logger.info("Branch pushed: %s", RELEASE_BRANCH)
+
+print("\n".join([
+    f"\n  📝 Step 3: Creating draft pull request...",
+    f"  ├─ Base: {TARGET_BRANCH}",
+    f"  ├─ Head: {RELEASE_BRANCH}",
+    f"  └─ Using comprehensive report as PR body",
+]))
+
+def create_draft_pr(title, body):
+    """Open the draft PR over the GitHub API (`gh pr create` as fallback); returns (url, error)."""
+    client = get_client()
+    if client:
+        try:
+            url, error = client.create_pr(REPO, TARGET_BRANCH, RELEASE_BRANCH, title, body, draft=True)
+            if url:
+                return url, ""
+            logger.warning("GitHub API PR creation failed, falling back to gh: %s", error)
+        except Exception as e:
+            logger.warning("GitHub API PR creation failed, falling back to gh: %s", e)
+
+    # Body goes through stdin: a large report can exceed the argv size limit
+    result = subprocess.run(
+        ["gh", "pr", "create",
+         "--base", TARGET_BRANCH,
+         "--head", RELEASE_BRANCH,
+         "--title", title,
+         "--body-file", "-",
+         "--draft",
+         "--repo", REPO],
+        input=body, capture_output=True, text=True
+    )
+    if result.returncode == 0:
+        return result.stdout.strip(), ""
+    return None, result.stderr
 
-# Add notifications if configured
-notify = cfg.get("notify", [])
-if notify:
-    notify_str = " ".join([f"@{n}" for n in notify])
-    pr_body += f"\n\n---\ncc: {notify_str}"
 
 # Create draft PR
 pr_title = f"Release {COMPONENT_NAME} v{VERSION}"
-create_pr_result = subprocess.run(
-    ["gh", "pr", "create",
-     "--base", TARGET_BRANCH,
-     "--head", RELEASE_BRANCH,
-     "--title", pr_title,
-     "--body", pr_body,
-     "--draft",
-     "--repo", REPO],
-    capture_output=True, text=True
-)
-
-if create_pr_result.returncode == 0:
-    pr_url = create_pr_result.stdout.strip()
-    print(f"\n  📤 SECTION 5 OUTPUT:")
-    print(f"  ├─ Draft PR Created: ✅")
-    print(f"  ├─ URL: {pr_url}")
-    print(f"  ├─ Report: {report_file}")
-    print(f"  └─ Status: Ready for review")
-    
-    print(f"\n  ✅ Draft PR created successfully!")
-    print(f"  🔗 {pr_url}")
-    logger.info(f"Draft PR created: {pr_url}")
+pr_url, create_pr_error = create_draft_pr(pr_title, pr_body)
+
+if pr_url:
+    print("\n".join([
+        f"\n  📤 SECTION 5 OUTPUT:",
+        f"  ├─ Draft PR Created: ✅",
+        f"  ├─ URL: {pr_url}",
+        f"  ├─ Report: {report_file}",
+        f"  └─ Status: Ready for review",
+        f"\n  ✅ Draft PR created successfully!",
+        f"  🔗 {pr_url}",
+    ]))
+    logger.info("Draft PR created: %s", pr_url)
 else:
-    print(f"\n  ❌ Failed to create draft PR")
-    print(f"  Error: {create_pr_result.stderr}")
-    logger.error(f"Failed to create draft PR: {create_pr_result.stderr}")
+    print(f"\n  ❌ Failed to create draft PR\n  Error: {create_pr_error}")
+    logger.error("Failed to create draft PR: %s", create_pr_error)
     sys.exit(1)
 
 #  ── Final Summary ────────────────────────────────────────────────────────────
-print(f"\n")
-print(c(BOLD, "═" * 70))
-print(c(BOLD, "  ✅ RELEASE ORCHESTRATION COMPLETE"))
-print(c(BOLD, "═" * 70))
-print(f"  Component:           {COMPONENT_NAME}")
-print(f"  Version:             {VERSION}")
-print(f"  Strategy:            {STRATEGY}")
-print(f"  Total Time:          {elapsed:.1f}s")
-print(f"  PRs Discovered:      {len(all_discovered_prs)}")
-print(f"  PRs Applied:         {len(successful_prs)}")
-print(f"  PRs Failed:          {len(failed_prs)}")
-print(f"  Conflicts Resolved:  {conflicts_resolved}")
-print(f"  Draft PR:            {pr_url if create_pr_result.returncode == 0 else 'N/A'}")
-print(c(BOLD, "═" * 70))
+# One write for the whole summary so it is never interleaved with other output
+print("\n".join([
+    "\n",
+    SUMMARY_RULE,
+    c(BOLD, "  ✅ RELEASE ORCHESTRATION COMPLETE"),
+    SUMMARY_RULE,
+    f"  Component:           {COMPONENT_NAME}",
+    f"  Version:             {VERSION}",
+    f"  Strategy:            {STRATEGY}",
+    f"  Total Time:          {elapsed:.1f}s",
+    f"  PRs Discovered:      {len(all_discovered_prs)}",
+    f"  PRs Applied:         {len(successful_prs)}",
+    f"  PRs Failed:          {len(failed_prs)}",
+    f"  Conflicts Resolved:  {conflicts_resolved}",
+    f"  Draft PR:            {pr_url or 'N/A'}",
+    SUMMARY_RULE,
+]))
 
 logger.info("Release orchestration completed successfully")
-sys.exit(0 if not failed_prs else 1)
+# Flush console and log file before exiting so CI captures the summary
+sys.stdout.flush()
+logging.shutdown()
+sys.exit(bool(failed_prs))
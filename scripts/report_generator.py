@@ -13,12 +13,39 @@ Generates detailed markdown reports for component owners including:
   - Complete audit trail
 """
 
-import json
+import io
+import os
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
+from itertools import chain
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
+from utils import read_json, write_json
+
+# Report icons per decision verdict and confidence level
+DECISION_EMOJI = {"INCLUDE": "✅", "EXCLUDE": "⏭️", "MANUAL_REVIEW": "🔍"}
+CONFIDENCE_EMOJI = {"HIGH": "🟢", "MEDIUM": "🟡", "LOW": "🔴"}
+
+# Fixed-layout header section, rendered with a single str.format() call
+REPORT_HEADER_TEMPLATE = """\
+# 🚀 Release Report — {component_name} v{version}
+
+| Field | Value |
+|-------|-------|
+| **Release Version** | `{version}` |
+| **Component** | `{component_name}` |
+| **Strategy** | `{strategy}` |
+| **Base Branch** | `{base_branch}` |
+| **Release Branch** | `{release_branch}` |
+| **Mode** | {mode} |
+| **Execution Time** | {execution_time:.1f}s |
+| **Report Generated** | {timestamp} |
+
+---
+
+"""
 
 @dataclass
 class ReleaseReport:
@@ -61,6 +88,14 @@ class ReleaseReport:
     execution_time: float
     dry_run: bool
     timestamp: str
+    
+    @property
+    def decision_counts(self) -> Counter:
+        """Number of LLM decisions per verdict (INCLUDE / EXCLUDE / MANUAL_REVIEW)."""
+        counts = getattr(self.llm_decisions, "decision_counts", None)
+        if counts is not None:
+            return counts()  # DecisionView: counted without building the dicts
+        return Counter(d['decision'] for d in self.llm_decisions.values())
 
 
 class ReportGenerator:
@@ -79,50 +114,104 @@ class ReportGenerator:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.data_dir = Path(data_dir)
+        self._data_files = {}  # file name -> (file stat key, parsed data)
+    
+    def _load_data_file(self, name: str) -> Any:
+        """
+        Parse a JSON artifact in data_dir, or return None if it does not exist.
+        
+        Parsed once and reused until the file changes (mtime/size), so
+        repeated reports from the shared generator do not re-read it.
+        """
+        path = self.data_dir / name
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._data_files.get(name)
+        if cached is None or cached[0] != key:
+            cached = self._data_files[name] = (key, read_json(path))
+        return cached[1]
+    
+    @property
+    def detailed_conflicts(self) -> Optional[List[Dict]]:
+        """Parsed detailed_conflicts.json, or None if it does not exist."""
+        return self._load_data_file("detailed_conflicts.json")
+    
+    @property
+    def pr_metadata(self) -> Dict:
+        """PR metadata from conflict_analysis.json (empty if there is none)."""
+        conflict_data = self._load_data_file("conflict_analysis.json")
+        return conflict_data.get("pr_metadata", {}) if conflict_data else {}
+    
+    def render_report(self, report_data: ReleaseReport) -> str:
+        """
+        Render the markdown report in memory.
+        
+        Args:
+            report_data: Report data
+            
+        Returns:
+            Report markdown
+        """
+        f = io.StringIO()
+        self._write_header(f, report_data)
+        self._write_executive_summary(f, report_data)
+        self._write_pr_discovery(f, report_data)
+        self._write_conflict_analysis(f, report_data)
+        self._write_llm_decisions(f, report_data)
+        self._write_dependency_validation(f, report_data)
+        self._write_execution_results(f, report_data)
+        self._write_recommendations(f, report_data)
+        self._write_next_steps(f, report_data)
+        self._write_footer(f, report_data)
+        return f.getvalue()
     
-    def generate_report(self, report_data: ReleaseReport) -> Path:
+    def generate_report(self, report_data: ReleaseReport, text: Optional[str] = None) -> Path:
         """
         Generate comprehensive markdown report.
         
         Args:
             report_data: Report data
+            text: Markdown already rendered with render_report(), if any
             
         Returns:
             Path to generated report file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # File name stamp from the report's own timestamp, so the two match
+        try:
+            generated_at = datetime.fromisoformat(report_data.timestamp)
+        except (TypeError, ValueError):
+            generated_at = datetime.now()
+        timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
         report_file = self.output_dir / f"{report_data.component_name}_{report_data.version}_report_{timestamp}.md"
         
-        with open(report_file, 'w', encoding='utf-8') as f:
-            self._write_header(f, report_data)
-            self._write_executive_summary(f, report_data)
-            self._write_pr_discovery(f, report_data)
-            self._write_conflict_analysis(f, report_data)
-            self._write_llm_decisions(f, report_data)
-            self._write_dependency_validation(f, report_data)
-            self._write_execution_results(f, report_data)
-            self._write_recommendations(f, report_data)
-            self._write_next_steps(f, report_data)
-            self._write_footer(f, report_data)
+        if text is None:
+            text = self.render_report(report_data)
+        # Atomic write: a crash mid-write never leaves a truncated report
+        tmp_file = report_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(text.encode('utf-8'))
+        tmp_file.replace(report_file)
+        
+        if report_data.llm_decisions:
+            # Audit-trail artifact referenced by the report
+            write_json(self.data_dir / "llm_decisions.json", dict(report_data.llm_decisions))
         
         return report_file
     
     def _write_header(self, f, data: ReleaseReport) -> None:
         """Write report header."""
-        f.write(f"# 🚀 Release Report — {data.component_name} v{data.version}\n\n")
-        
-        # Summary table
-        f.write("| Field | Value |\n")
-        f.write("|-------|-------|\n")
-        f.write(f"| **Release Version** | `{data.version}` |\n")
-        f.write(f"| **Component** | `{data.component_name}` |\n")
-        f.write(f"| **Strategy** | `{data.strategy.upper()}` |\n")
-        f.write(f"| **Base Branch** | `{data.base_branch}` |\n")
-        f.write(f"| **Release Branch** | `{data.release_branch}` |\n")
-        f.write(f"| **Mode** | {'🔍 DRY RUN (Simulation)' if data.dry_run else '✅ LIVE EXECUTION'} |\n")
-        f.write(f"| **Execution Time** | {data.execution_time:.1f}s |\n")
-        f.write(f"| **Report Generated** | {data.timestamp} |\n")
-        f.write("\n---\n\n")
+        f.write(REPORT_HEADER_TEMPLATE.format(
+            component_name=data.component_name,
+            version=data.version,
+            strategy=data.strategy.upper(),
+            base_branch=data.base_branch,
+            release_branch=data.release_branch,
+            mode="🔍 DRY RUN (Simulation)" if data.dry_run else "✅ LIVE EXECUTION",
+            execution_time=data.execution_time,
+            timestamp=data.timestamp,
+        ))
     
     def _write_executive_summary(self, f, data: ReleaseReport) -> None:
         """Write executive summary."""
@@ -144,7 +233,9 @@ class ReportGenerator:
                 f.write(f"| **PRs Skipped** | {len(data.skipped_prs)} | ⏭️ Excluded by LLM |\n")
         
         if len(data.llm_decisions) > 0:
+            counts = data.decision_counts
             f.write(f"| **LLM Decisions** | {len(data.llm_decisions)} | 🤖 AI-powered analysis |\n")
+            f.write(f"| **LLM Verdicts** | {counts['INCLUDE']} / {counts['EXCLUDE']} / {counts['MANUAL_REVIEW']} | 🤖 Include / Exclude / Review |\n")
             f.write(f"| **LLM Include** | {len(data.prs_to_include)} | ✅ Recommended |\n")
             f.write(f"| **LLM Exclude** | {len(data.prs_to_exclude)} | ⏭️ Not recommended |\n")
             f.write(f"| **Manual Review** | {len(data.prs_manual_review)} | 🔍 Needs human review |\n")
@@ -164,8 +255,7 @@ class ReportGenerator:
         if data.strategy == "include":
             f.write(f"### PRs Configured for Inclusion ({len(data.prs_configured)})\n\n")
             if data.prs_configured:
-                for pr in data.prs_configured:
-                    f.write(f"- PR #{pr}\n")
+                f.write("".join(f"- PR #{pr}\n" for pr in data.prs_configured))
                 f.write("\n")
             else:
                 f.write("*No PRs configured*\n\n")
@@ -176,8 +266,7 @@ class ReportGenerator:
         else:
             f.write(f"### PRs Configured for Exclusion ({len(data.prs_configured)})\n\n")
             if data.prs_configured:
-                for pr in data.prs_configured:
-                    f.write(f"- PR #{pr}\n")
+                f.write("".join(f"- PR #{pr}\n" for pr in data.prs_configured))
                 f.write("\n")
             
             to_include = data.total_prs_discovered - len(data.prs_configured)
@@ -189,14 +278,10 @@ class ReportGenerator:
         """Write conflict analysis section with detailed information."""
         f.write("## ⚠️ Conflict Analysis\n\n")
         
-        # Load detailed conflict data from runtime
-        detailed_conflicts_file = self.data_dir / "detailed_conflicts.json"
-        has_detailed_conflicts = detailed_conflicts_file.exists()
+        # Detailed conflict data from runtime
+        detailed_conflicts = self.detailed_conflicts
         
-        if has_detailed_conflicts:
-            with open(detailed_conflicts_file) as cf:
-                detailed_conflicts = json.load(cf)
-            
+        if detailed_conflicts is not None:
             if detailed_conflicts:
                 total_conflicts = len(detailed_conflicts)
                 total_files = sum(len(c['files']) for c in detailed_conflicts)
@@ -209,6 +294,7 @@ class ReportGenerator:
                 f.write("| PR # | Operation | Files | Conflict Details |\n")
                 f.write("|------|-----------|-------|------------------|\n")
                 
+                rows = []
                 for conflict_info in detailed_conflicts:
                     pr_num = conflict_info['pr_number']
                     operation = conflict_info['operation']
@@ -236,35 +322,39 @@ class ReportGenerator:
                     files_str = f"{len(files)} file(s)"
                     details_str = "<br>".join(details_parts) if details_parts else "No line details"
                     
-                    f.write(f"| #{pr_num} | {operation} | {files_str} | {details_str} |\n")
+                    rows.append(f"| #{pr_num} | {operation} | {files_str} | {details_str} |\n")
                 
-                f.write("\n")
+                rows.append("\n")
+                f.write("".join(rows))
                 
-                # Expandable detailed view
-                f.write("<details>\n")
-                f.write("<summary><b>📋 Click to view full conflict details</b></summary>\n\n")
+                # Expandable detailed view (accumulated, written once)
+                lines = [
+                    "<details>\n",
+                    "<summary><b>📋 Click to view full conflict details</b></summary>\n\n",
+                ]
                 
                 for conflict_info in detailed_conflicts:
                     pr_num = conflict_info['pr_number']
-                    f.write(f"\n#### PR #{pr_num} Conflicts\n\n")
+                    lines.append(f"\n#### PR #{pr_num} Conflicts\n\n")
                     
                     for file_info in conflict_info.get('detailed_conflicts', []):
-                        f.write(f"**File**: `{file_info['file']}`\n\n")
-                        f.write(f"- **Total Conflicts**: {file_info['total_conflicts']}\n")
+                        lines.append(f"**File**: `{file_info['file']}`\n\n")
+                        lines.append(f"- **Total Conflicts**: {file_info['total_conflicts']}\n")
                         
                         for i, conf in enumerate(file_info['conflicts'], 1):
-                            f.write(f"\n**Conflict {i}**: Lines {conf['start_line']}-{conf['end_line']}\n")
-                            f.write(f"- **Our Branch**: {conf.get('our_branch', 'N/A')}\n")
-                            f.write(f"- **Their Branch**: {conf.get('their_branch', 'N/A')}\n")
+                            lines.append(f"\n**Conflict {i}**: Lines {conf['start_line']}-{conf['end_line']}\n")
+                            lines.append(f"- **Our Branch**: {conf.get('our_branch', 'N/A')}\n")
+                            lines.append(f"- **Their Branch**: {conf.get('their_branch', 'N/A')}\n")
                             
                             if conf.get('our_content'):
-                                f.write(f"- **Our Changes**: {len(conf['our_content'])} line(s)\n")
+                                lines.append(f"- **Our Changes**: {len(conf['our_content'])} line(s)\n")
                             if conf.get('their_content'):
-                                f.write(f"- **Their Changes**: {len(conf['their_content'])} line(s)\n")
+                                lines.append(f"- **Their Changes**: {len(conf['their_content'])} line(s)\n")
                         
-                        f.write("\n")
+                        lines.append("\n")
                 
-                f.write("</details>\n\n")
+                lines.append("</details>\n\n")
+                f.write("".join(lines))
             else:
                 f.write("> ✅ **No conflicts encountered during execution**. All PRs applied cleanly.\n\n")
         else:
@@ -287,18 +377,18 @@ class ReportGenerator:
         
         f.write(f"**Total Decisions**: {len(data.llm_decisions)}\n\n")
         
-        # Group by decision
-        include = [pr for pr, d in data.llm_decisions.items() if d['decision'] == 'INCLUDE']
-        exclude = [pr for pr, d in data.llm_decisions.items() if d['decision'] == 'EXCLUDE']
-        manual = [pr for pr, d in data.llm_decisions.items() if d['decision'] == 'MANUAL_REVIEW']
+        counts = data.decision_counts
+        
+        # Sorted once by PR number, shared by both tables below
+        ordered_decisions = sorted(data.llm_decisions.items(), key=lambda x: int(x[0]))
         
         # Summary table
         f.write("### Decision Summary\n\n")
         f.write("| Decision | Count | Confidence | Action |\n")
         f.write("|----------|:-----:|:----------:|--------|\n")
-        f.write(f"| ✅ **INCLUDE** | {len(include)} | AI-Recommended | Auto-applied to release |\n")
-        f.write(f"| ⏭️ **EXCLUDE** | {len(exclude)} | AI-Recommended | Skipped from release |\n")
-        f.write(f"| 🔍 **MANUAL_REVIEW** | {len(manual)} | Needs Human | Component owner must review |\n")
+        f.write(f"| ✅ **INCLUDE** | {counts['INCLUDE']} | AI-Recommended | Auto-applied to release |\n")
+        f.write(f"| ⏭️ **EXCLUDE** | {counts['EXCLUDE']} | AI-Recommended | Skipped from release |\n")
+        f.write(f"| 🔍 **MANUAL_REVIEW** | {counts['MANUAL_REVIEW']} | Needs Human | Component owner must review |\n")
         f.write("\n")
         
         # Detailed decisions table
@@ -307,38 +397,46 @@ class ReportGenerator:
             f.write("| PR # | Decision | Confidence | Rationale |\n")
             f.write("|------|----------|:----------:|----------|\n")
             
-            for pr_num, decision in sorted(data.llm_decisions.items(), key=lambda x: int(x[0])):
-                emoji = "✅" if decision['decision'] == "INCLUDE" else "⏭️" if decision['decision'] == "EXCLUDE" else "🔍"
-                conf_emoji = "🟢" if decision['confidence'] == "HIGH" else "🟡" if decision['confidence'] == "MEDIUM" else "🔴"
+            rows = []
+            for pr_num, decision in ordered_decisions:
+                verdict = decision['decision']
+                confidence = decision['confidence']
+                emoji = DECISION_EMOJI.get(verdict, "🔍")
+                conf_emoji = CONFIDENCE_EMOJI.get(confidence, "🔴")
                 rationale = decision['rationale'].replace('|', '\\|')[:80]
-                f.write(f"| #{pr_num} | {emoji} {decision['decision']} | {conf_emoji} {decision['confidence']} | {rationale} |\n")
-            f.write("\n")
+                rows.append(f"| #{pr_num} | {emoji} {verdict} | {conf_emoji} {confidence} | {rationale} |\n")
+            rows.append("\n")
+            f.write("".join(rows))
         
         # High-value decisions expansion
-        if include or manual:
+        if counts['INCLUDE'] or counts['MANUAL_REVIEW']:
             f.write("<details>\n")
             f.write("<summary>📋 Detailed Analysis (expand for full rationale)</summary>\n\n")
             
-            for pr_num, decision in sorted(data.llm_decisions.items(), key=lambda x: int(x[0])):
-                if decision['decision'] in ['INCLUDE', 'MANUAL_REVIEW']:
-                    emoji = "✅" if decision['decision'] == "INCLUDE" else "🔍"
-                    f.write(f"#### {emoji} PR #{pr_num}: {decision['decision']} ({decision['confidence']})\n\n")
-                    f.write(f"**Rationale**: {decision['rationale']}\n\n")
+            for pr_num, decision in ordered_decisions:
+                verdict = decision['decision']
+                if verdict in ('INCLUDE', 'MANUAL_REVIEW'):
+                    emoji = DECISION_EMOJI[verdict]
+                    # Each decision's block is assembled and written at once
+                    block = [
+                        f"#### {emoji} PR #{pr_num}: {verdict} ({decision['confidence']})\n\n",
+                        f"**Rationale**: {decision['rationale']}\n\n",
+                    ]
                     
                     if decision.get('requires_prs'):
-                        f.write(f"**Requires PRs**: {decision['requires_prs']}\n\n")
+                        block.append(f"**Requires PRs**: {decision['requires_prs']}\n\n")
                     
                     if decision.get('benefits'):
-                        f.write("**Benefits**:\n")
-                        for benefit in decision['benefits']:
-                            f.write(f"- {benefit}\n")
-                        f.write("\n")
+                        block.append("**Benefits**:\n")
+                        block.extend(f"- {benefit}\n" for benefit in decision['benefits'])
+                        block.append("\n")
                     
                     if decision.get('risks'):
-                        f.write("**Risks**:\n")
-                        for risk in decision['risks']:
-                            f.write(f"- {risk}\n")
-                        f.write("\n")
+                        block.append("**Risks**:\n")
+                        block.extend(f"- {risk}\n" for risk in decision['risks'])
+                        block.append("\n")
+                    
+                    f.write("".join(block))
             
             f.write("</details>\n\n")
         
@@ -357,21 +455,20 @@ class ReportGenerator:
             f.write("### Missing Dependencies\n\n")
             f.write("| Included PR | Depends On PR(s) | Action Required |\n")
             f.write("|-------------|------------------|------------------|\n")
-            for pr, deps in data.missing_dependencies.items():
-                deps_str = ', '.join([f"#{d}" for d in deps])
-                f.write(f"| PR #{pr} | {deps_str} | ⚠️ Add dependencies to config |\n")
+            f.write("".join(
+                f"| PR #{pr} | {', '.join(f'#{d}' for d in deps)} | ⚠️ Add dependencies to config |\n"
+                for pr, deps in data.missing_dependencies.items()
+            ))
             f.write("\n")
         
         if data.dependency_warnings:
             f.write("### ⚠️ Warnings\n\n")
-            for warning in data.dependency_warnings:
-                f.write(f"- {warning}\n")
+            f.write("".join(f"- {warning}\n" for warning in data.dependency_warnings))
             f.write("\n")
         
         if data.dependency_recommendations:
             f.write("### 💡 Recommendations\n\n")
-            for rec in data.dependency_recommendations:
-                f.write(f"- {rec}\n")
+            f.write("".join(f"- {rec}\n" for rec in data.dependency_recommendations))
             f.write("\n")
         
         f.write("---\n\n")
@@ -386,51 +483,54 @@ class ReportGenerator:
         
         f.write("## 🚀 Execution Results\n\n")
         
-        # Load PR metadata from conflict analysis file
-        pr_metadata = {}
-        conflict_file = self.data_dir / "conflict_analysis.json"
-        if conflict_file.exists():
-            with open(conflict_file) as cf:
-                conflict_data = json.load(cf)
-                pr_metadata = conflict_data.get("pr_metadata", {})
+        # PR metadata from the conflict analysis file
+        pr_metadata = self.pr_metadata
         
         if data.successful_prs:
             f.write(f"### ✅ Successfully Applied ({len(data.successful_prs)} PRs)\n\n")
             f.write("| PR # | Title | Author | Status |\n")
             f.write("|------|-------|--------|--------|\n")
+            rows = []
             for pr_num in data.successful_prs:
                 pr_info = pr_metadata.get(str(pr_num), {})
                 title = pr_info.get('title', f'PR #{pr_num}').replace('|', '\\|')[:60]
                 author = pr_info.get('author', 'unknown')
-                f.write(f"| #{pr_num} | {title} | @{author} | ✅ Applied |\n")
-            f.write("\n")
+                rows.append(f"| #{pr_num} | {title} | @{author} | ✅ Applied |\n")
+            rows.append("\n")
+            f.write("".join(rows))
         
         if data.failed_prs:
             f.write(f"### ❌ Failed / Needs Manual Review ({len(data.failed_prs)} PRs)\n\n")
             f.write("| PR # | Title | Author | Action Required |\n")
             f.write("|------|-------|--------|------------------|\n")
+            rows = []
             for pr_num in data.failed_prs:
                 pr_info = pr_metadata.get(str(pr_num), {})
                 title = pr_info.get('title', f'PR #{pr_num}').replace('|', '\\|')[:60]
                 author = pr_info.get('author', 'unknown')
-                f.write(f"| #{pr_num} | {title} | @{author} | 🔧 Manual resolution required |\n")
-            f.write("\n")
+                rows.append(f"| #{pr_num} | {title} | @{author} | 🔧 Manual resolution required |\n")
+            rows.append("\n")
+            f.write("".join(rows))
         
         if data.skipped_prs:
             f.write(f"### ⏭️ Skipped ({len(data.skipped_prs)} PRs)\n\n")
             f.write("| PR # | Title | Author | Reason |\n")
             f.write("|------|-------|--------|--------|\n")
+            llm_decisions = data.llm_decisions
+            rows = []
             for pr_num in data.skipped_prs:
-                pr_info = pr_metadata.get(str(pr_num), {})
+                key = str(pr_num)
+                pr_info = pr_metadata.get(key, {})
                 title = pr_info.get('title', f'PR #{pr_num}').replace('|', '\\|')[:60]
                 author = pr_info.get('author', 'unknown')
                 # Find LLM decision reason
                 reason = "Excluded by strategy"
-                if data.llm_decisions and str(pr_num) in data.llm_decisions:
-                    decision = data.llm_decisions[str(pr_num)]
+                decision = llm_decisions.get(key)
+                if decision:
                     reason = decision.get('rationale', 'Excluded')[:50]
-                f.write(f"| #{pr_num} | {title} | @{author} | {reason} |\n")
-            f.write("\n")
+                rows.append(f"| #{pr_num} | {title} | @{author} | {reason} |\n")
+            rows.append("\n")
+            f.write("".join(rows))
         
         f.write("---\n\n")
     
@@ -454,9 +554,7 @@ class ReportGenerator:
         
         # Check for dependency issues
         if data.missing_dependencies:
-            prs_to_add = set()
-            for deps in data.missing_dependencies.values():
-                prs_to_add.update(deps)
+            prs_to_add = set(chain.from_iterable(data.missing_dependencies.values()))
             recommendations.append(
                 f"**Add Missing Dependencies**: Consider adding PRs {sorted(prs_to_add)} to satisfy dependencies"
             )
@@ -469,8 +567,7 @@ class ReportGenerator:
             )
         
         if recommendations:
-            for i, rec in enumerate(recommendations, 1):
-                f.write(f"{i}. {rec}\n\n")
+            f.write("".join(f"{i}. {rec}\n\n" for i, rec in enumerate(recommendations, 1)))
         else:
             f.write("✅ **No specific recommendations** - Release plan looks good!\n\n")
         
@@ -544,3 +641,14 @@ class ReportGenerator:
         
         f.write("---\n\n")
         f.write(f"*Report generated by Release Agent on {data.timestamp}*\n")
+
+
+_report_generator = None
+
+
+def get_report_generator() -> ReportGenerator:
+    """Shared ReportGenerator with the default directories, created on first use."""
+    global _report_generator
+    if _report_generator is None:
+        _report_generator = ReportGenerator()
+    return _report_generator
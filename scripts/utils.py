@@ -7,22 +7,48 @@ Common utility functions for the RDK-B release agent scripts.
 Provides:
   - ANSI color formatting
   - Console output helpers
+  - JSON artifact read/write helpers (optionally on a background thread)
+  - Per-user private cache directory
+  - Git worktree helpers
+  - Diff pruning for LLM prompts
   - Shared constants
 """
 
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import List
+
+try:
+    import orjson  # Optional: 3-10x faster JSON for large artifacts
+except ImportError:
+    orjson = None
+
 # ── ANSI Color Codes ──────────────────────────────────────────────────────────
-GREEN  = "\033[92m"
-YELLOW = "\033[93m"
-RED    = "\033[91m"
-CYAN   = "\033[96m"
-BOLD   = "\033[1m"
-DIM    = "\033[2m"
-RESET  = "\033[0m"
+# Disabled when stdout is not a terminal (CI logs, pipes) or NO_COLOR is set
+COLOR_ENABLED = sys.stdout.isatty() and "NO_COLOR" not in os.environ
+
+if COLOR_ENABLED:
+    GREEN  = "\033[92m"
+    YELLOW = "\033[93m"
+    RED    = "\033[91m"
+    CYAN   = "\033[96m"
+    BOLD   = "\033[1m"
+    DIM    = "\033[2m"
+    RESET  = "\033[0m"
+else:
+    GREEN = YELLOW = RED = CYAN = BOLD = DIM = RESET = ""
 
 
 # ── Color Helper Functions ────────────────────────────────────────────────────
 def c(color: str, text: str) -> str:
-    """Apply ANSI color to text."""
+    """Apply ANSI color to text (plain text when colors are disabled)."""
+    if not COLOR_ENABLED:
+        return text
     return f"{color}{text}{RESET}"
 
 
@@ -57,11 +83,16 @@ def bold(msg: str) -> str:
 
 
 # ── Banner and Section Helpers ────────────────────────────────────────────────
-def banner(title: str, width: int = 64) -> None:
+BANNER_WIDTH = 64
+BANNER_RULE = c(BOLD, "═" * BANNER_WIDTH)      # Built once, reused by every banner
+SECTION_RULE = c(DIM, "  " + "─" * 56)
+HEAVY_RULE = "  " + "━" * 42                  # Phase / decision separators
+
+
+def banner(title: str, width: int = BANNER_WIDTH) -> None:
     """Print a formatted banner with title."""
-    print("\n" + c(BOLD, "═" * width))
-    print(c(BOLD, f"  {title}"))
-    print(c(BOLD, "═" * width))
+    rule = BANNER_RULE if width == BANNER_WIDTH else c(BOLD, "═" * width)
+    print(f"\n{rule}\n{c(BOLD, f'  {title}')}\n{rule}")
 
 
 def section(step: int, title: str, start_time: float = None) -> None:
@@ -72,4 +103,236 @@ def section(step: int, title: str, start_time: float = None) -> None:
         print(f"\n{c(BOLD, f'[Step {step}]')} {title}  {dim(f'+{elapsed:.1f}s')}")
     else:
         print(f"\n{c(BOLD, f'[Step {step}]')} {title}")
-    print(c(DIM, "  " + "─" * 56))
+    print(SECTION_RULE)
+
+
+# ── Per-User Cache Directory ──────────────────────────────────────────────────
+# Caches whose contents are trusted when read back (diffs, PR metadata, PR
+# discovery, LLM verdicts) live here rather than in the world-writable
+# /tmp/rdkb-release-conflicts, where another local user could plant entries.
+USER_CACHE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+) / "rdkb-release-agent"
+
+
+def make_cache_dir(path: Path) -> Path:
+    """
+    Create a directory under USER_CACHE_DIR, with the cache root private (0700).
+    
+    Raises:
+        PermissionError: If the cache root belongs to another user
+    """
+    USER_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = USER_CACHE_DIR.stat()
+    if st.st_uid != os.getuid():
+        raise PermissionError(f"Cache directory {USER_CACHE_DIR} is not owned by the current user")
+    if st.st_mode & 0o077:
+        os.chmod(USER_CACHE_DIR, 0o700)
+    path = Path(path)
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return path
+
+
+# ── JSON Artifact Helpers ─────────────────────────────────────────────────────
+def write_json(path, data, indent: bool = True) -> None:
+    """
+    Write data to a JSON file.
+    
+    Uses orjson when installed (serializes straight to bytes, int dict keys
+    allowed), otherwise falls back to the stdlib json module.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2 if indent else None)
+
+
+def append_jsonl(path, entry) -> None:
+    """Append one record to a JSON Lines log (orjson when installed)."""
+    if orjson is not None:
+        line = orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    else:
+        line = (json.dumps(entry) + "\n").encode()
+    with open(path, "ab") as f:
+        f.write(line)
+
+
+def read_jsonl(path) -> List:
+    """
+    Read a JSON Lines log. Unparseable lines (e.g. a record cut short by a
+    crash mid-append) are skipped.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    records = []
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                records.append(loads(line))
+            except ValueError:
+                continue
+    return records
+
+
+def read_json(path):
+    """Read a JSON file (orjson when installed, stdlib json otherwise)."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+
+# Single worker: queued writes run in submission order, so the last write
+# to a path always wins
+_write_pool = None
+_pending_writes = []
+
+
+def write_json_background(path, data, indent: bool = True) -> None:
+    """
+    Queue write_json() on a background thread and return immediately.
+    
+    data must not be mutated afterwards (pass a copy). Call flush_writes()
+    before the file is read back.
+    """
+    global _write_pool
+    if _write_pool is None:
+        _write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="json-writer")
+    _pending_writes.append(_write_pool.submit(write_json, path, data, indent))
+
+
+def flush_writes() -> None:
+    """Wait for all queued background writes; re-raises the first failure."""
+    pending = _pending_writes[:]
+    _pending_writes.clear()
+    errors = [future.exception() for future in pending]
+    for error in errors:
+        if error is not None:
+            raise error
+
+
+# ── Git Helpers ───────────────────────────────────────────────────────────────
+def unmerged_files(cwd=None) -> List[str]:
+    """
+    List files with unresolved merge conflicts in a worktree (default: the
+    current directory).
+    
+    Parses `git status --porcelain=v2 -z -uno` in one subprocess: unmerged
+    entries start with "u " and end with the path (NUL-terminated, so paths
+    with spaces or special characters need no unquoting).
+    
+    Returns:
+        List of conflicted file paths (empty if none or not a git repo)
+    """
+    result = subprocess.run(
+        ["git", "status", "--porcelain=v2", "-z", "-uno"],
+        capture_output=True, text=True, cwd=cwd
+    )
+    if result.returncode != 0:
+        return []
+    
+    files = []
+    records = iter(result.stdout.split("\0"))
+    for record in records:
+        if record.startswith("u "):
+            # u <XY> <sub> <m1> <m2> <m3> <mW> <h1> <h2> <h3> <path>
+            files.append(record.split(" ", 10)[10])
+        elif record.startswith("2 "):
+            next(records, None)  # Skip the rename/copy original path
+    return files
+
+
+# ── Diff Pruning ──────────────────────────────────────────────────────────────
+# Files whose diffs carry no decision signal for the LLM
+PRUNE_EXCLUDED_FILES = ("package-lock.json", "yarn.lock", "*.min.js", "*.pb.go")
+PRUNE_HUNK_MAX_LINES = 200  # Hunks longer than this are collapsed...
+PRUNE_HUNK_KEEP_LINES = 50  # ...to this many lines from the head and tail
+PRUNE_TRUNCATED_MARKER = "\n... (diff truncated)"
+
+
+def _collapse_hunk(lines: List[str], out: List[str]) -> None:
+    """Append a hunk, collapsing it to head + tail if it is very long."""
+    if len(lines) <= PRUNE_HUNK_MAX_LINES:
+        out.extend(lines)
+        return
+    # lines[0] is the @@ header; keep it plus the first and last lines
+    body = lines[1:]
+    out.append(lines[0])
+    out.extend(body[:PRUNE_HUNK_KEEP_LINES])
+    out.append(f"... ({len(body) - 2 * PRUNE_HUNK_KEEP_LINES} lines elided)")
+    out.extend(body[-PRUNE_HUNK_KEEP_LINES:])
+
+
+def _prune_file_diff(lines: List[str], out: List[str]) -> None:
+    """Append one file's diff (starting at its `diff --git` line), pruned."""
+    path = lines[0].rsplit(" b/", 1)[-1]
+    name = path.rsplit("/", 1)[-1]
+    if any(fnmatch(name, pattern) for pattern in PRUNE_EXCLUDED_FILES):
+        out.append(lines[0])
+        out.append(f"... (generated/lock file diff omitted: {path})")
+        return
+    
+    hunk = None
+    for line in lines:
+        if line.startswith("Binary files ") or line == "GIT binary patch":
+            out.append(f"... (binary file diff omitted: {path})")
+            return
+        if line.startswith("@@"):
+            if hunk is not None:
+                _collapse_hunk(hunk, out)
+            hunk = [line]
+        elif hunk is not None:
+            hunk.append(line)
+        else:
+            out.append(line)  # File header lines
+    if hunk is not None:
+        _collapse_hunk(hunk, out)
+
+
+def prune_diff(diff: str, max_bytes: int = 32_000) -> str:
+    """
+    Shrink a unified diff before it is sent to an LLM.
+    
+    Lock files and generated files (PRUNE_EXCLUDED_FILES) and binary
+    patches are reduced to a one-line note, hunks longer than
+    PRUNE_HUNK_MAX_LINES keep only their first and last
+    PRUNE_HUNK_KEEP_LINES lines, and the result is cut to max_bytes.
+    
+    Args:
+        diff: Unified diff text (e.g. from `gh pr diff`)
+        max_bytes: Upper bound on the UTF-8 size of the result (at least
+            the length of PRUNE_TRUNCATED_MARKER)
+    
+    Returns:
+        Pruned diff text
+    """
+    if not diff:
+        return diff
+    
+    out: List[str] = []
+    # Split into per-file sections; any preamble before the first
+    # `diff --git` line (or a non-git diff) is kept as is
+    sections: List[List[str]] = [[]]
+    for line in diff.split("\n"):
+        if line.startswith("diff --git "):
+            sections.append([])
+        sections[-1].append(line)
+    out.extend(sections[0])
+    for section_lines in sections[1:]:
+        _prune_file_diff(section_lines, out)
+    
+    pruned = "\n".join(out)
+    encoded = pruned.encode()
+    if len(encoded) > max_bytes:
+        # Leave room for the marker, and cut at the last complete line
+        budget = max(0, max_bytes - len(PRUNE_TRUNCATED_MARKER))
+        head = encoded[:budget].decode(errors="ignore")
+        pruned = head.rsplit("\n", 1)[0] + PRUNE_TRUNCATED_MARKER
+    return pruned
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+test_dependency_ordering.py
+===========================
+Test script to verify dependency-aware PR ordering in pr_discovery.py
+
+This script tests:
+1. Prerequisite PRs are applied before the PRs requiring them
+2. Independent PRs keep their original (merge) order
+3. Dependencies on PRs outside the release are ignored
+4. Dependency cycles are reported instead of aborting
+"""
+
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+
+from pr_discovery import order_prs_by_dependencies
+
+
+def test_prerequisites_first():
+    """Test that a required PR is moved ahead of its dependent."""
+    print("\n" + "="*70)
+    print("TEST 1: Prerequisites First")
+    print("="*70)
+
+    # PR 10 requires 30, PR 20 requires 10
+    ordered, cycles = order_prs_by_dependencies([10, 20, 30], {10: [30], 20: [10]})
+    print(f"  Ordered: {ordered}")
+
+    assert ordered == [30, 10, 20], "Prerequisites should come first"
+    assert cycles == [], "Should not report cycles"
+    print("  ✅ Prerequisites ordered first")
+
+
+def test_stable_order():
+    """Test that independent PRs keep their input order."""
+    print("\n" + "="*70)
+    print("TEST 2: Stable Order for Independent PRs")
+    print("="*70)
+
+    ordered, cycles = order_prs_by_dependencies([5, 3, 9, 1], {})
+    print(f"  Ordered: {ordered}")
+
+    assert ordered == [5, 3, 9, 1], "Order should be unchanged without dependencies"
+
+    # Only the dependent PR moves; the others keep their relative order
+    ordered, cycles = order_prs_by_dependencies([5, 3, 9, 1], {3: [1]})
+    print(f"  Ordered with 3 -> 1: {ordered}")
+
+    assert ordered == [5, 9, 1, 3], "Only the dependent PR should move"
+    print("  ✅ Independent PRs keep merge order")
+
+
+def test_external_dependencies_ignored():
+    """Test that dependencies on PRs outside the list are ignored."""
+    print("\n" + "="*70)
+    print("TEST 3: External Dependencies Ignored")
+    print("="*70)
+
+    ordered, cycles = order_prs_by_dependencies([1, 2], {1: [99], 2: [2]})
+    print(f"  Ordered: {ordered}")
+
+    assert ordered == [1, 2], "External and self dependencies should be ignored"
+    assert cycles == [], "Should not report cycles"
+    print("  ✅ External dependencies ignored")
+
+
+def test_cycle_detection():
+    """Test that cycles are reported and no PR is dropped."""
+    print("\n" + "="*70)
+    print("TEST 4: Cycle Detection")
+    print("="*70)
+
+    # 2 <-> 3 form a cycle; 4 requires 3 (blocked behind the cycle); 1 is free
+    ordered, cycles = order_prs_by_dependencies(
+        [1, 2, 3, 4], {2: [3], 3: [2], 4: [3]}
+    )
+    print(f"  Ordered: {ordered}")
+    print(f"  Cycles: {cycles}")
+
+    assert cycles == [[2, 3]], "Should report the 2 <-> 3 cycle"
+    assert ordered == [1, 2, 3, 4], "All PRs should be kept in their original order"
+    print("  ✅ Cycle reported, original order kept")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "="*70)
+    print("DEPENDENCY ORDERING - TEST SUITE")
+    print("="*70)
+
+    try:
+        test_prerequisites_first()
+        test_stable_order()
+        test_external_dependencies_ignored()
+        test_cycle_detection()
+
+        print("\n" + "="*70)
+        print("✅ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
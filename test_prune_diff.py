@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+test_prune_diff.py
+==================
+Test script to verify LLM diff pruning in utils.py
+
+This script tests:
+1. Lock files and generated files are reduced to a note
+2. Binary patches are reduced to a note
+3. Very long hunks keep only their head and tail
+4. The result never exceeds max_bytes
+"""
+
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+
+from utils import prune_diff, PRUNE_HUNK_KEEP_LINES
+
+
+def file_diff(path, body_lines):
+    """Build a one-hunk git diff for a file."""
+    lines = [
+        f"diff --git a/{path} b/{path}",
+        "index 1111111..2222222 100644",
+        f"--- a/{path}",
+        f"+++ b/{path}",
+        f"@@ -1,{len(body_lines)} +1,{len(body_lines)} @@",
+    ]
+    return "\n".join(lines + body_lines)
+
+
+def test_excluded_files_omitted():
+    """Test that lock and generated file diffs are dropped."""
+    print("\n" + "="*70)
+    print("TEST 1: Excluded Files Omitted")
+    print("="*70)
+
+    source = file_diff("source/wifi_dml.c", ["+    if (ptr == NULL) return -1;"])
+    lock = file_diff("ui/package-lock.json", [f'+  "dep{i}": "1.0.{i}",' for i in range(100)])
+    minified = file_diff("ui/static/app.min.js", ["+var a=1;" * 50])
+
+    pruned = prune_diff("\n".join([source, lock, minified]))
+    print(f"  Pruned diff:\n{pruned}")
+
+    assert "ptr == NULL" in pruned, "Source changes should be kept"
+    assert '"dep1"' not in pruned, "Lock file content should be dropped"
+    assert "var a=1" not in pruned, "Minified JS should be dropped"
+    assert "generated/lock file diff omitted: ui/package-lock.json" in pruned
+    print("  ✅ Lock/generated files omitted, source kept")
+
+
+def test_binary_files_omitted():
+    """Test that binary patches are reduced to a note."""
+    print("\n" + "="*70)
+    print("TEST 2: Binary Files Omitted")
+    print("="*70)
+
+    diff = "\n".join([
+        "diff --git a/docs/logo.png b/docs/logo.png",
+        "index 1111111..2222222 100644",
+        "GIT binary patch",
+        "literal 1024",
+        "zcmV-q1DpJbP)<h;3K|Lk000e1NJLTq",
+    ])
+
+    pruned = prune_diff(diff)
+    print(f"  Pruned diff:\n{pruned}")
+
+    assert "zcmV" not in pruned, "Binary payload should be dropped"
+    assert "binary file diff omitted: docs/logo.png" in pruned
+    print("  ✅ Binary patch omitted")
+
+
+def test_long_hunk_collapsed():
+    """Test that a long hunk keeps only its first and last lines."""
+    print("\n" + "="*70)
+    print("TEST 3: Long Hunk Collapsed")
+    print("="*70)
+
+    body = [f"+line {i}" for i in range(500)]
+    pruned = prune_diff(file_diff("source/big.c", body))
+    kept = [line for line in pruned.split("\n") if line.startswith("+line")]
+    print(f"  Kept {len(kept)} of {len(body)} hunk lines")
+
+    assert len(kept) == 2 * PRUNE_HUNK_KEEP_LINES, "Should keep head + tail only"
+    assert "+line 0" in kept and "+line 499" in kept, "Should keep first and last lines"
+    assert "+line 250" not in kept, "Middle lines should be elided"
+    assert "lines elided" in pruned, "Should mark the elision"
+
+    short = file_diff("source/small.c", ["+a", "-b"])
+    assert prune_diff(short) == short, "Short diffs should be unchanged"
+    print("  ✅ Long hunk collapsed, short diff untouched")
+
+
+def test_max_bytes():
+    """Test that the pruned diff is capped at max_bytes."""
+    print("\n" + "="*70)
+    print("TEST 4: Byte Limit")
+    print("="*70)
+
+    diff = "\n".join(file_diff(f"source/f{i}.c", ["+x" * 40] * 100) for i in range(20))
+    for max_bytes in (2000, 32_000, 100):
+        pruned = prune_diff(diff, max_bytes=max_bytes)
+        print(f"  {len(diff.encode())} bytes -> {len(pruned.encode())} bytes (max {max_bytes})")
+
+        assert len(pruned.encode()) <= max_bytes, "Should respect max_bytes"
+        assert pruned.endswith("... (diff truncated)"), "Should mark the truncation"
+
+    # A single long line (no newline to cut at) is still capped
+    pruned = prune_diff("x" * 500, max_bytes=100)
+    assert len(pruned.encode()) <= 100, "Should cap a diff without newlines"
+    assert prune_diff("") == "", "Empty diff should stay empty"
+    print("  ✅ Byte limit enforced")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "="*70)
+    print("DIFF PRUNING - TEST SUITE")
+    print("="*70)
+
+    try:
+        test_excluded_files_omitted()
+        test_binary_files_omitted()
+        test_long_hunk_collapsed()
+        test_max_bytes()
+
+        print("\n" + "="*70)
+        print("✅ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
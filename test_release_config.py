@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+test_release_config.py
+======================
+Test script to verify release config validation in release_config.py
+
+This script tests:
+1. Minimal and full valid configs produce no errors
+2. Wrong value types are reported with the offending key
+3. Nested objects (llm) are validated, accepting floats for numeric settings
+   and enforcing lower bounds (max_concurrency, rps)
+4. Array items (prs, notify) are validated with their index
+5. version/strategy rules and the "include requires prs" rule
+"""
+
+import sys
+from pathlib import Path
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent / "scripts"))
+
+from release_config import validate_release_config
+
+
+def test_valid_configs():
+    """Test that minimal and full configs validate cleanly."""
+    print("\n" + "="*70)
+    print("TEST 1: Valid Configs")
+    print("="*70)
+
+    errors = validate_release_config({"version": "2.3.0", "strategy": "exclude"})
+    print(f"  Minimal: {errors}")
+    assert errors == [], "Minimal config should be valid"
+
+    errors = validate_release_config({
+        "component_name": "CcspPandM",
+        "version": 2.3,
+        "strategy": "include",
+        "prs": [101, "102"],
+        "dry_run": True,
+        "base_branch": "develop",
+        "notify": ["@release-team"],
+        "llm": {
+            "enabled": True,
+            "provider": "openai",
+            "temperature": 0.2,
+            "timeout_seconds": 60,
+            "max_concurrency": 8,
+            "rps": 10,
+            "prefilter": False
+        }
+    })
+    print(f"  Full: {errors}")
+    assert errors == [], "Full config should be valid"
+    print("  ✅ Valid configs accepted")
+
+
+def test_type_errors():
+    """Test that wrong top-level value types are reported."""
+    print("\n" + "="*70)
+    print("TEST 2: Type Errors")
+    print("="*70)
+
+    errors = validate_release_config({
+        "version": "2.3.0",
+        "strategy": "exclude",
+        "dry_run": "yes",
+        "prs": 101,
+    })
+    print(f"  Errors: {errors}")
+
+    assert "'dry_run' must be boolean (got: str)" in errors, "Should reject string dry_run"
+    assert "'prs' must be array (got: int)" in errors, "Should reject non-list prs"
+    assert len(errors) == 2, "Should report exactly the two bad keys"
+
+    # None is treated as missing, not as a type error
+    errors = validate_release_config({"version": "2.3.0", "strategy": "exclude", "notify": None})
+    assert errors == [], "None values should be treated as missing"
+    print("  ✅ Type errors reported")
+
+
+def test_nested_objects():
+    """Test that the llm section is validated key by key."""
+    print("\n" + "="*70)
+    print("TEST 3: Nested Objects")
+    print("="*70)
+
+    # Floats are valid for every numeric llm setting
+    errors = validate_release_config({
+        "version": "2.3.0",
+        "strategy": "exclude",
+        "llm": {"timeout_seconds": 60.0, "rps": 2.5, "max_calls_per_run": 50.0},
+    })
+    print(f"  Float settings: {errors}")
+    assert errors == [], "Float timeouts/rates should be accepted"
+
+    errors = validate_release_config({
+        "version": "2.3.0",
+        "strategy": "exclude",
+        "llm": {"enabled": "true", "timeout_seconds": "60", "async": 1},
+    })
+    print(f"  Errors: {errors}")
+    assert "'llm.enabled' must be boolean (got: str)" in errors
+    assert "'llm.timeout_seconds' must be number (got: str)" in errors
+    assert "'llm.async' must be boolean (got: int)" in errors
+
+    errors = validate_release_config({
+        "version": "2.3.0",
+        "strategy": "exclude",
+        "llm": {"max_concurrency": 0, "rps": -1},
+    })
+    print(f"  Below minimum: {errors}")
+    assert errors == [
+        "'llm.max_concurrency' must be at least 1 (got: 0)",
+        "'llm.rps' must be at least 0 (got: -1)",
+    ], "max_concurrency and rps should have lower bounds"
+
+    errors = validate_release_config({"version": "2.3.0", "strategy": "exclude", "llm": True})
+    assert errors == ["'llm' must be object (got: bool)"], "llm must be a mapping"
+    print("  ✅ Nested llm settings validated")
+
+
+def test_arrays():
+    """Test that array items are validated with their index."""
+    print("\n" + "="*70)
+    print("TEST 4: Arrays")
+    print("="*70)
+
+    errors = validate_release_config({
+        "version": "2.3.0",
+        "strategy": "exclude",
+        "prs": [101, 2.5, True],
+        "notify": ["@a", 7],
+    })
+    print(f"  Errors: {errors}")
+
+    assert "'prs[1]' must be integer or string (got: float)" in errors
+    assert "'prs[2]' must be integer or string (got: bool)" in errors
+    assert "'notify[1]' must be string (got: int)" in errors
+    assert len(errors) == 3, "Valid items should not be reported"
+    print("  ✅ Array items validated")
+
+
+def test_version_strategy_prs_rules():
+    """Test the required keys, strategy enum and include/prs rule."""
+    print("\n" + "="*70)
+    print("TEST 5: Version / Strategy / PRs Rules")
+    print("="*70)
+
+    errors = validate_release_config({})
+    print(f"  Empty: {errors}")
+    assert errors == ["'version' is required", "'strategy' is required"]
+
+    errors = validate_release_config({"version": "", "strategy": "merge"})
+    print(f"  Bad values: {errors}")
+    assert "'version' must not be empty" in errors
+    assert "'strategy' must be 'exclude' or 'include' (got: 'merge')" in errors
+
+    include_msg = "'prs' list is REQUIRED when strategy is 'include'"
+    for prs in (None, []):
+        errors = validate_release_config({"version": "2.3.0", "strategy": "include", "prs": prs})
+        print(f"  include with prs={prs}: {errors}")
+        assert errors == [include_msg], "include strategy needs a non-empty prs list"
+
+    errors = validate_release_config({"version": "2.3.0", "strategy": "exclude", "prs": []})
+    assert errors == [], "exclude strategy may have an empty prs list"
+    print("  ✅ version/strategy/prs rules enforced")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "="*70)
+    print("RELEASE CONFIG VALIDATION - TEST SUITE")
+    print("="*70)
+
+    try:
+        test_valid_configs()
+        test_type_errors()
+        test_nested_objects()
+        test_arrays()
+        test_version_strategy_prs_rules()
+
+        print("\n" + "="*70)
+        print("✅ ALL TESTS PASSED")
+        print("="*70)
+
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()